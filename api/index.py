@@ -5,14 +5,28 @@ Vercel-compatible Flask application entry point for RealLife AI Email System
 import os
 import sys
 
+__all__ = ['app', 'application']
+
+# The deployment filesystem is read-only; use the bytecode shipped with the
+# bundle and never try to write new .pyc files
+sys.dont_write_bytecode = True
+
 # Add the parent directory to Python path for imports
 current_dir = os.path.dirname(__file__)
 parent_dir = os.path.dirname(current_dir)
-sys.path.insert(0, parent_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+# Drop duplicate and non-existent entries before the heavy imports below so
+# each module lookup probes fewer locations on the function's filesystem
+sys.path[:] = [d for d in dict.fromkeys(sys.path) if d and os.path.exists(d)]
 
 try:
-    # Import the email server application
+    # Import the email server application at module scope so Flask, SQLAlchemy
+    # and the model classes are loaded during the function's init phase rather
+    # than on the first request
     from email_server import app
+
     print("Successfully imported Flask app")
 except Exception as e:
     print(f"Import error: {e}")
@@ -10,6 +10,9 @@ import subprocess
 import platform
 import json
 import shutil
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import version, PackageNotFoundError
 from pathlib import Path
 
 class CompleteBuilder:
@@ -19,38 +22,100 @@ class CompleteBuilder:
         self.is_windows = self.system == "windows"
         self.is_linux = self.system == "linux"
         self.is_macos = self.system == "darwin"
+        self.manifest_file = self.project_root / ".build_manifest.json"
 
-    def print_header(self, text):
+    def print_header(self, text, log=print):
         """Print a formatted header"""
-        print("\n" + "=" * 60)
-        print(f" {text}")
-        print("=" * 60)
+        log("\n" + "=" * 60)
+        log(f" {text}")
+        log("=" * 60)
 
-    def run_command(self, command, description, cwd=None, shell=False):
-        """Run a command with proper error handling"""
-        print(f"🔧 {description}...")
-        try:
-            if isinstance(command, str):
-                command = command.split() if not shell else command
+    def run_command_async(self, command, description, cwd=None, shell=False, capture=False, log=print):
+        """Start a command without waiting for it to finish"""
+        log(f"🔧 {description}...")
+        if isinstance(command, str):
+            command = command.split() if not shell else command
 
-            result = subprocess.run(
+        try:
+            return subprocess.Popen(
                 command,
                 cwd=cwd or self.project_root,
                 shell=shell,
-                capture_output=True,
-                text=True,
-                check=True
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE if capture else subprocess.STDOUT,
+                bufsize=1,
+                text=True
             )
-            print(f"✅ {description} completed")
-            return result.stdout.strip()
-        except subprocess.CalledProcessError as e:
-            print(f"❌ {description} failed: {e}")
-            print(f"Error output: {e.stderr}")
-            return None
         except FileNotFoundError:
-            print(f"❌ Command not found: {command[0] if isinstance(command, list) else command.split()[0]}")
+            log(f"❌ Command not found: {command[0] if isinstance(command, list) else command.split()[0]}")
+            return None
+
+    def wait_command(self, process, description, capture=False, log=print):
+        """Wait for a command started with run_command_async, streaming or capturing its output"""
+        if process is None:
             return None
 
+        if capture:
+            stdout, stderr = process.communicate()
+        else:
+            # Stream line by line so long pip/npm runs show progress and
+            # their output is never held in memory as a whole
+            for line in process.stdout:
+                log(line, end='')
+            process.wait()
+            stdout, stderr = "", None
+
+        if process.returncode != 0:
+            error = subprocess.CalledProcessError(process.returncode, process.args)
+            log(f"❌ {description} failed: {error}")
+            if stderr:
+                log(f"Error output: {stderr}")
+            return None
+
+        log(f"✅ {description} completed")
+        return stdout.strip()
+
+    def run_command(self, command, description, cwd=None, shell=False, capture=False, log=print):
+        """Run a command with proper error handling"""
+        process = self.run_command_async(command, description, cwd=cwd, shell=shell, capture=capture, log=log)
+        return self.wait_command(process, description, capture=capture, log=log)
+
+    def run_captured(self, step_function):
+        """Run a step with its output collected instead of printed, returning (result, output)"""
+        lines = []
+
+        def log(*args, end='\n'):
+            lines.append(" ".join(map(str, args)) + end)
+
+        return step_function(log=log), "".join(lines)
+
+    def file_hash(self, name):
+        """Return the SHA-256 of a project file, or None if it is missing"""
+        path = self.project_root / name
+        if not path.exists():
+            return None
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+
+    def load_build_manifest(self):
+        """Load the fingerprint recorded by the last successful build"""
+        try:
+            with open(self.manifest_file, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_build_manifest(self, manifest):
+        """Record the fingerprint of a successful build"""
+        with open(self.manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+    def clear_build_manifest(self):
+        """Forget the last build so the next one runs every step"""
+        try:
+            self.manifest_file.unlink()
+        except FileNotFoundError:
+            pass
+
     def check_python_version(self):
         """Check Python version compatibility"""
         self.print_header("CHECKING PYTHON VERSION")
@@ -89,31 +154,31 @@ class CompleteBuilder:
         print("✅ Python dependencies installed")
         return True
 
-    def install_node_dependencies(self):
+    def install_node_dependencies(self, log=print):
         """Install Node.js dependencies for Cloudflare deployment"""
-        self.print_header("INSTALLING NODE.JS DEPENDENCIES")
+        self.print_header("INSTALLING NODE.JS DEPENDENCIES", log=log)
 
         # Check if Node.js is installed
-        node_check = self.run_command("node --version", "Checking Node.js")
+        node_check = self.run_command("node --version", "Checking Node.js", capture=True, log=log)
         if node_check is None:
-            print("⚠️ Node.js not found - Cloudflare deployment will be skipped")
-            print("Install Node.js from https://nodejs.org for full deployment")
+            log("⚠️ Node.js not found - Cloudflare deployment will be skipped")
+            log("Install Node.js from https://nodejs.org for full deployment")
             return True  # Not critical for basic operation
 
-        npm_check = self.run_command("npm --version", "Checking npm")
+        npm_check = self.run_command("npm --version", "Checking npm", capture=True, log=log)
         if npm_check is None:
-            print("❌ npm not found")
+            log("❌ npm not found")
             return False
 
         # Install dependencies
         package_file = self.project_root / "package.json"
         if package_file.exists():
-            success = self.run_command("npm install", "Installing npm packages")
+            success = self.run_command("npm install", "Installing npm packages", log=log)
             if success is None:
-                print("❌ Failed to install npm dependencies")
+                log("❌ Failed to install npm dependencies")
                 return False
 
-        print("✅ Node.js dependencies installed")
+        log("✅ Node.js dependencies installed")
         return True
 
     def setup_database(self):
@@ -123,12 +188,15 @@ class CompleteBuilder:
         try:
             # Import here to check if dependencies are available
             sys.path.insert(0, str(self.project_root))
-            from email_server import app
+            from import_utils import cached_import
+            app = cached_import('email_server', 'app')
 
             with app.app_context():
-                from email_server import db, create_sample_emails
+                ensure_schema = cached_import('email_server', 'ensure_schema')
+                create_sample_emails = cached_import('email_server', 'create_sample_emails')
                 print("Creating database tables...")
-                db.create_all()
+                if not ensure_schema():
+                    print("Database schema is up to date")
                 print("Creating sample data...")
                 create_sample_emails()
 
@@ -180,31 +248,32 @@ class CompleteBuilder:
         self.print_header("VERIFYING INSTALLATION")
 
         checks = [
-            ("Flask", "import flask; print('Flask:', flask.__version__)"),
-            ("SQLAlchemy", "import flask_sqlalchemy; print('SQLAlchemy: OK')"),
-            ("Bcrypt", "import flask_bcrypt; print('Bcrypt: OK')"),
-            ("PIL/Pillow", "import PIL; print('PIL:', PIL.__version__)"),
-            ("Tkinter", "import tkinter; print('Tkinter: OK')"),
-            ("Requests", "import requests; print('Requests:', requests.__version__)"),
+            ("Flask", "Flask"),
+            ("SQLAlchemy", "Flask-SQLAlchemy"),
+            ("Bcrypt", "Flask-Bcrypt"),
+            ("PIL/Pillow", "Pillow"),
+            ("Requests", "requests"),
         ]
 
         all_passed = True
 
-        for name, test_code in checks:
+        # Read versions from the installed distributions' metadata so no
+        # package code has to run just to report a version
+        for name, distribution in checks:
             try:
-                result = self.run_command(
-                    [sys.executable, "-c", test_code],
-                    f"Testing {name}",
-                    shell=False
-                )
-                if result:
-                    print(f"✅ {name}: {result}")
-                else:
-                    print(f"✅ {name}: Available")
-            except Exception as e:
-                print(f"❌ {name}: Failed - {e}")
+                print(f"✅ {name}: {version(distribution)}")
+            except PackageNotFoundError:
+                print(f"❌ {name}: Not installed")
                 all_passed = False
 
+        # Tkinter ships with Python rather than as a distribution
+        try:
+            import tkinter
+            print("✅ Tkinter: OK")
+        except ImportError as e:
+            print(f"❌ Tkinter: Failed - {e}")
+            all_passed = False
+
         if all_passed:
             print("\n🎉 All verifications passed!")
         else:
@@ -213,77 +282,39 @@ class CompleteBuilder:
         return all_passed
 
     def create_startup_script(self):
-        """Create a comprehensive startup script"""
+        """Prepare the checked-in startup script"""
         self.print_header("CREATING STARTUP SCRIPT")
 
-        startup_script = f'''#!/usr/bin/env python3
-"""
-RealLife AI Tools - Complete System Launcher
-Launches both GUI and web server simultaneously
-"""
-
-import os
-import sys
-import subprocess
-import threading
-import time
-import webbrowser
-from pathlib import Path
-
-def main():
-    print("=" * 60)
-    print("     RealLife AI Tools - Complete System")
-    print("=" * 60)
-    print("🚀 Launching GUI + Web Server + AI Host")
-    print("=" * 60)
-
-    project_root = Path(__file__).parent
-
-    # Start email server in background
-    print("📧 Starting Email Server...")
-    server_thread = threading.Thread(
-        target=lambda: subprocess.run([
-            sys.executable, "-c",
-            """
-import sys
-sys.path.insert(0, '.')
-from email_server import app
-print('Email server running on http://localhost:5000')
-app.run(host='0.0.0.0', port=5000, debug=False, use_reloader=False)
-            """
-        ], cwd=project_root),
-        daemon=True
-    )
-    server_thread.start()
-
-    # Wait for server to start
-    time.sleep(3)
-
-    # Launch GUI
-    print("🖥️  Launching GUI Application...")
-    try:
-        from gui_main import ModernChromeGUI
-        gui = ModernChromeGUI()
-        gui.run()
-    except KeyboardInterrupt:
-        print("\\n👋 Shutting down gracefully...")
-    except Exception as e:
-        print(f"❌ GUI Error: {{e}}")
-        print("💡 The web server may still be running on http://localhost:5000")
-
-if __name__ == "__main__":
-    main()
-'''
-
         startup_file = self.project_root / "start_complete_system.py"
-        with open(startup_file, 'w', encoding='utf-8') as f:
-            f.write(startup_script)
+        if not startup_file.exists():
+            print("❌ start_complete_system.py not found")
+            return False
 
         # Make executable on Unix systems
         if not self.is_windows:
             os.chmod(startup_file, 0o755)
 
-        print("✅ Startup script created: start_complete_system.py")
+        print("✅ Startup script ready: start_complete_system.py")
+        return True
+
+    def compile_bytecode(self):
+        """Precompile the serverless bundle so cold starts skip compilation"""
+        self.print_header("COMPILING BYTECODE")
+
+        # Hash-checked .pyc files stay valid when deployment rewrites source
+        # mtimes; only the Vercel entry point and its imports are compiled
+        result = self.run_command(
+            [sys.executable, "-m", "compileall", "-q", "-f",
+             "--invalidation-mode", "checked-hash",
+             "email_server.py", "api"],
+            "Compiling bytecode"
+        )
+
+        if result is None:
+            print("❌ Failed to compile bytecode")
+            return False
+
+        print("✅ Bytecode compiled")
         return True
 
     def build_all(self):
@@ -300,6 +331,7 @@ if __name__ == "__main__":
             ("Desktop Shortcuts", self.create_desktop_shortcuts),
             ("Installation Verification", self.verify_installation),
             ("Startup Script Creation", self.create_startup_script),
+            ("Bytecode Compilation", self.compile_bytecode),
         ]
 
         optional_steps = [
@@ -309,23 +341,73 @@ if __name__ == "__main__":
         completed_steps = 0
         total_steps = len(steps) + len(optional_steps)
 
-        # Required steps
-        for step_name, step_function in steps:
-            print(f"\\n[{completed_steps + 1}/{total_steps}] {step_name}")
-            if step_function():
-                completed_steps += 1
-            else:
-                print(f"❌ {step_name} failed - build cannot continue")
-                return False
-
-        # Optional steps
-        for step_name, step_function in optional_steps:
-            print(f"\\n[{completed_steps + 1}/{total_steps}] {step_name} (Optional)")
-            if step_function():
-                completed_steps += 1
-            else:
-                print(f"⚠️ {step_name} failed - skipping optional component")
-                completed_steps += 1  # Still count as completed since it's optional
+        # Skip install and verification steps whose inputs have not changed
+        # since the last successful build
+        manifest = self.load_build_manifest()
+        fingerprint = {
+            "requirements_hash": self.file_hash("requirements.txt"),
+            "package_hash": self.file_hash("package.json"),
+            "python_version": sys.version,
+            # A new or recreated environment with the same Python has nothing installed yet
+            "python_prefix": sys.prefix,
+        }
+        skipped_steps = set()
+        same_python = all(manifest.get(key) == fingerprint[key] for key in ("python_version", "python_prefix"))
+        if same_python:
+            if manifest.get("requirements_hash") == fingerprint["requirements_hash"]:
+                skipped_steps.update({"Python Dependencies", "Installation Verification"})
+            if manifest.get("package_hash") == fingerprint["package_hash"]:
+                skipped_steps.add("Node.js Dependencies")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            # Optional steps use other package managers than pip, so they
+            # run in the background while the required steps proceed; their
+            # output is collected and shown under their own header afterwards
+            optional_futures = [
+                (step_name, None if step_name in skipped_steps else executor.submit(self.run_captured, step_function))
+                for step_name, step_function in optional_steps
+            ]
+
+            # Required steps
+            for step_name, step_function in steps:
+                print(f"\\n[{completed_steps + 1}/{total_steps}] {step_name}")
+                if step_name in skipped_steps:
+                    print(f"⏭️ {step_name} unchanged since last build - skipped")
+                    completed_steps += 1
+                elif step_function():
+                    completed_steps += 1
+                else:
+                    print(f"❌ {step_name} failed - build cannot continue")
+                    self.clear_build_manifest()
+                    # Leaving the executor waits for background steps already
+                    # running, so show their output instead of waiting silently
+                    for optional_name, future in optional_futures:
+                        if future is not None and not future.cancel():
+                            print(f"\n{optional_name} (Optional) - started before the failure:")
+                            print(future.result()[1], end='')
+                    return False
+
+            # Optional steps
+            optional_results = {}
+            for step_name, future in optional_futures:
+                print(f"\\n[{completed_steps + 1}/{total_steps}] {step_name} (Optional)")
+                if future is None:
+                    print(f"⏭️ {step_name} unchanged since last build - skipped")
+                    completed_steps += 1
+                    continue
+
+                optional_results[step_name], output = future.result()
+                print(output, end='')
+                if not optional_results[step_name]:
+                    print(f"⚠️ {step_name} failed - skipping optional component")
+                completed_steps += 1  # Counted either way since it's optional
+
+        # Only remember package.json once npm has actually installed it
+        if "Node.js Dependencies" not in skipped_steps and not (
+            optional_results.get("Node.js Dependencies") and (self.project_root / "node_modules").exists()
+        ):
+            fingerprint["package_hash"] = None
+        self.save_build_manifest(fingerprint)
 
         self.print_header("BUILD COMPLETE")
 
@@ -4,31 +4,50 @@ System Status Checker for RealLife AI Tools
 Verifies that both GUI and web server are working properly
 """
 
+import os
 import sys
-import requests
+import asyncio
+import importlib
+import importlib.util
 import subprocess
 import time
 import socket
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+from import_utils import cached_import
+
 def print_header(text):
     """Print a formatted header"""
     print("\n" + "=" * 60)
     print(f" {text}")
     print("=" * 60)
 
+LOCAL_HOSTS = ('localhost', '127.0.0.1')
+
 def check_port_open(host, port):
     """Check if a port is open"""
+    # A loopback connect either succeeds or is refused almost instantly
+    timeout = 0.05 if host in LOCAL_HOSTS else 1
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1)
-        result = sock.connect_ex((host, port))
-        sock.close()
-        return result == 0
-    except:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            return sock.connect_ex((host, port)) == 0
+    except OSError:
         return False
 
-def check_web_server():
+def create_http_session():
+    """Create a pooled HTTP session shared by the web server checks"""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+    session.mount('http://', adapter)
+    return session
+
+def check_web_server(session=None):
     """Check if the web server is running and responding"""
     print_header("WEB SERVER STATUS")
 
@@ -41,8 +60,9 @@ def check_web_server():
     print("✅ Web server port 5000 is open")
 
     # Check health endpoint
+    import requests
     try:
-        response = requests.get("http://localhost:5000/health", timeout=5)
+        response = (session or requests).get("http://localhost:5000/health", timeout=5)
         if response.status_code == 200:
             health_data = response.json()
             print("✅ Health check passed")
@@ -62,19 +82,22 @@ def check_gui_imports():
     print_header("GUI COMPONENT CHECK")
 
     try:
-        # Test basic imports
-        import tkinter
-        print("✅ Tkinter available")
-
-        import PIL
-        print("✅ PIL/Pillow available")
+        # Test basic imports, skipping the import machinery entirely for
+        # modules that are already loaded
+        cached_names = set(sys.modules)
+        for module_name, label in (("tkinter", "Tkinter"), ("PIL", "PIL/Pillow")):
+            if module_name not in cached_names:
+                importlib.import_module(module_name)
+                cached_names.add(module_name)
+            print(f"✅ {label} available")
 
         # Test GUI-specific imports
-        from gui_main import ModernChromeGUI, EmbeddedDiscordBrowser
+        cached_import('gui_main', 'ModernChromeGUI')
+        cached_import('gui_main', 'EmbeddedDiscordBrowser')
         print("✅ GUI classes can be imported")
 
         # Test email server import
-        from email_server import app
+        cached_import('email_server', 'app')
         print("✅ Email server can be imported")
 
         print("✅ All GUI components ready")
@@ -93,10 +116,11 @@ def check_database():
     print_header("DATABASE STATUS")
 
     try:
-        from email_server import app, db
+        app = cached_import('email_server', 'app')
         with app.app_context():
             # Try to query the database
-            from email_server import User, EmailMessage
+            User = cached_import('email_server', 'User')
+            EmailMessage = cached_import('email_server', 'EmailMessage')
             user_count = User.query.count()
             email_count = EmailMessage.query.count()
 
@@ -110,7 +134,39 @@ def check_database():
         print("💡 The database will be created when you first run the system")
         return False
 
-def check_api_endpoints():
+async def fetch_statuses_async(urls):
+    """Fetch the status code of every URL concurrently on one event loop"""
+    import aiohttp
+
+    async def probe(http, url):
+        try:
+            async with http.get(url) as response:
+                return response.status
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as http:
+        return await asyncio.gather(*(probe(http, url) for url in urls))
+
+def fetch_statuses_threaded(urls, session=None):
+    """Fetch the status code of every URL in parallel over a pooled session"""
+    import requests
+    http = session or create_http_session()
+
+    def probe(url):
+        try:
+            return http.get(url, timeout=5).status_code
+        except requests.RequestException:
+            return None
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            return list(executor.map(probe, urls))
+    finally:
+        if session is None:
+            http.close()
+
+def check_api_endpoints(session=None):
     """Check various API endpoints"""
     print_header("API ENDPOINT CHECK")
 
@@ -121,19 +177,25 @@ def check_api_endpoints():
         ("Login", "/login"),
         ("Dashboard", "/dashboard"),
     ]
+    urls = [f"http://localhost:5000{endpoint}" for _, endpoint in endpoints]
+
+    # All probes are independent; use a single event loop when aiohttp is
+    # installed, otherwise a thread pool over the shared requests session
+    if importlib.util.find_spec("aiohttp") is not None:
+        statuses = asyncio.run(fetch_statuses_async(urls))
+    else:
+        statuses = fetch_statuses_threaded(urls, session)
 
     working_endpoints = 0
 
-    for name, endpoint in endpoints:
-        try:
-            response = requests.get(f"http://localhost:5000{endpoint}", timeout=5)
-            if response.status_code in [200, 302]:  # 302 is redirect, which is OK
-                print(f"✅ {name} ({endpoint}): {response.status_code}")
-                working_endpoints += 1
-            else:
-                print(f"⚠️  {name} ({endpoint}): {response.status_code}")
-        except requests.RequestException:
+    for (name, endpoint), status in zip(endpoints, statuses):
+        if status is None:
             print(f"❌ {name} ({endpoint}): Not accessible")
+        elif status in [200, 302]:  # 302 is redirect, which is OK
+            print(f"✅ {name} ({endpoint}): {status}")
+            working_endpoints += 1
+        else:
+            print(f"⚠️  {name} ({endpoint}): {status}")
 
     if working_endpoints == len(endpoints):
         print("✅ All API endpoints working")
@@ -142,6 +204,25 @@ def check_api_endpoints():
         print(f"⚠️  {working_endpoints}/{len(endpoints)} endpoints working")
         return working_endpoints > 0
 
+# Directory listings keyed by path, reused while the directory's mtime is unchanged
+_listing_cache = {}
+
+def list_directory(directory):
+    """Return the set of entry names in a directory, normalized with os.path.normcase"""
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        return set()
+
+    cached = _listing_cache.get(directory)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    # normcase folds case on Windows, matching how os.path.exists() resolves names there
+    names = {os.path.normcase(name) for name in os.listdir(directory)}
+    _listing_cache[directory] = (mtime, names)
+    return names
+
 def check_file_structure():
     """Check if all required files are present"""
     print_header("FILE STRUCTURE CHECK")
@@ -164,9 +245,10 @@ def check_file_structure():
     project_root = Path(__file__).parent
     missing_files = []
 
+    # One listing per directory instead of one stat() per file
     for file_path in required_files:
-        full_path = project_root / file_path
-        if full_path.exists():
+        parent, name = os.path.split(file_path)
+        if os.path.normcase(name) in list_directory(project_root / parent):
             print(f"✅ {file_path}")
         else:
             print(f"❌ {file_path} - MISSING")
@@ -183,12 +265,15 @@ def run_full_system_test():
     """Run a comprehensive system test"""
     print_header("COMPLETE SYSTEM TEST")
 
+    # The HTTP checks share one session so they reuse pooled connections
+    session = create_http_session()
+
     tests = [
         ("File Structure", check_file_structure),
         ("GUI Components", check_gui_imports),
-        ("Web Server", check_web_server),
+        ("Web Server", partial(check_web_server, session)),
         ("Database", check_database),
-        ("API Endpoints", check_api_endpoints),
+        ("API Endpoints", partial(check_api_endpoints, session)),
     ]
 
     passed_tests = 0
@@ -205,6 +290,8 @@ def run_full_system_test():
         except Exception as e:
             print(f"❌ {test_name}: ERROR - {e}")
 
+    session.close()
+
     print_header("TEST RESULTS")
 
     if passed_tests == total_tests:
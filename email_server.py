@@ -4,19 +4,27 @@ Local Email Server for Discord Account Management
 Features: User registration, login, email sending/receiving, web interface
 """
 
-from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify
+from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify, g
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, func, inspect, or_, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import deferred, undefer
 from flask_bcrypt import Bcrypt
-from flask_mail import Mail, Message
+from flask_mail import Mail
+from jinja2 import FileSystemBytecodeCache
 import os
-import secrets
-from datetime import datetime, timedelta
+import sys
 import json
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-import threading
+import hmac
+import hashlib
 import time
+import queue
+import threading
+import secrets
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 
 app = Flask(__name__)
 
@@ -29,9 +37,41 @@ else:
     db_path = os.path.join(os.path.dirname(__file__), 'email_server.db')
     print(f"Running locally, using database path: {db_path}")
 
-app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', secrets.token_hex(32))
+def load_or_create_secret(path):
+    """Return the secret key persisted at path, generating it on first use"""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        pass
+
+    # Write privately, then link into place so concurrent workers agree on one key
+    secret = secrets.token_hex(32)
+    temp_path = f"{path}.{os.getpid()}"
+    try:
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(secret)
+        os.link(temp_path, path)
+    except FileExistsError:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError as e:
+        print(f"Could not persist secret key ({e}) - sessions will reset on restart")
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return secret
+
+app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY') or load_or_create_secret(db_path + '.secret')
 app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['BCRYPT_LOG_ROUNDS'] = 12
+# One pool shared by the threaded dev server and multi-threaded workers
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_pre_ping': True,
+    'connect_args': {'check_same_thread': False}
+}
 
 # Email configuration (for local testing - in production, use proper SMTP)
 app.config['MAIL_SERVER'] = 'smtp.gmail.com'  # Change for your email provider
@@ -40,29 +80,94 @@ app.config['MAIL_USE_TLS'] = True
 app.config['MAIL_USERNAME'] = os.environ.get('EMAIL_USER', 'your-email@gmail.com')
 app.config['MAIL_PASSWORD'] = os.environ.get('EMAIL_PASS', 'your-password')
 app.config['MAIL_DEFAULT_SENDER'] = app.config['MAIL_USERNAME']
+# Simulate sending unless EMAIL_SEND=1
+app.config['MAIL_SUPPRESS_SEND'] = os.environ.get('EMAIL_SEND') != '1'
+
+# Optional Redis backing for sessions and per-user caches (set REDIS_URL)
+redis_client = None
+if os.environ.get('REDIS_URL'):
+    try:
+        import redis
+        redis_client = redis.Redis.from_url(os.environ['REDIS_URL'])
+    except ImportError:
+        print("REDIS_URL is set but redis is not installed - caching disabled")
+
+if redis_client is not None:
+    try:
+        from flask_session import Session
+        app.config['SESSION_TYPE'] = 'redis'
+        app.config['SESSION_REDIS'] = redis_client
+        Session(app)
+    except ImportError:
+        print("Flask-Session is not installed - using cookie sessions")
+
+# Log N+1 lazy loads during development when nplusone is installed
+if os.environ.get('FLASK_DEBUG'):
+    try:
+        from nplusone.ext.flask_sqlalchemy import NPlusOne
+        NPlusOne(app)
+    except ImportError:
+        pass
+
+# Seconds a cached user row stays in Redis
+USER_CACHE_TTL = 300
+
+# Outgoing mail is handed to these workers so requests don't wait on SMTP
+mail_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='mail')
+
+# (EmailMessage id or None, recipient, subject, body, sender) tuples waiting to go out;
+# one flush drains them over a single connection
+outgoing_mail = queue.Queue()
+mail_flush_lock = threading.Lock()
+
+# Seconds a successful login skips bcrypt for the same credentials
+LOGIN_CACHE_TTL = 300
+LOGIN_CACHE_MAX = 10000
+_login_cache = {}
+
+# Reuse compiled templates across cold starts instead of re-parsing them
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
 
 db = SQLAlchemy(app)
 bcrypt = Bcrypt(app)
 mail = Mail(app)
 
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL so readers never block on the writer, and relax fsync"""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.close()
+
+# Bump whenever a model's tables, columns or indexes change
+SCHEMA_VERSION = 5
+
 # Database Models
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
     password = db.Column(db.String(120), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, nullable=False, server_default=func.now())
     is_verified = db.Column(db.Boolean, default=False)
-    verification_token = db.Column(db.String(120), unique=True)
+    # SHA-256 of the emailed token; the token itself is never stored
+    verification_token_hash = db.Column(db.LargeBinary(32), unique=True, index=True)
 
 class EmailMessage(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     sender_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     recipient_email = db.Column(db.String(120), nullable=False)
     subject = db.Column(db.String(200), nullable=False)
-    body = db.Column(db.Text, nullable=False)
-    sent_at = db.Column(db.DateTime, default=datetime.utcnow)
+    body = deferred(db.Column(db.Text, nullable=False))  # only loaded when read
+    sent_at = db.Column(db.DateTime, nullable=False, server_default=func.now())
     is_read = db.Column(db.Boolean, default=False)
+    status = db.Column(db.String(20), default='pending')  # pending, sent or failed
 
     sender = db.relationship('User', backref=db.backref('sent_emails', lazy=True))
 
@@ -71,16 +176,27 @@ class ReceivedEmail(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     sender_email = db.Column(db.String(120), nullable=False)
     subject = db.Column(db.String(200), nullable=False)
-    body = db.Column(db.Text, nullable=False)
-    received_at = db.Column(db.DateTime, default=datetime.utcnow)
+    body = deferred(db.Column(db.Text, nullable=False))  # only loaded when read
+    received_at = db.Column(db.DateTime, nullable=False, server_default=func.now())
     is_read = db.Column(db.Boolean, default=False)
 
     user = db.relationship('User', backref=db.backref('received_emails', lazy=True))
 
+    # Cover the newest-first mailbox listing and the unread count
+    __table_args__ = (
+        db.Index('ix_recv_user_time', 'user_id', received_at.desc()),
+        db.Index('ix_recv_user_unread', 'user_id', 'is_read'),
+    )
+
 # Routes
+@app.before_request
+def load_user():
+    """Resolve the logged-in user once per request into g.user"""
+    g.user = get_current_user() if request.endpoint != 'static' else None
+
 @app.route('/')
 def index():
-    if 'user_id' in session:
+    if g.user is not None:
         return redirect(url_for('dashboard'))
     return render_template('index.html')
 
@@ -107,11 +223,17 @@ def register():
             flash('Passwords do not match', 'error')
             return redirect(url_for('register'))
 
-        if User.query.filter_by(username=username).first():
+        # One narrow query covers both uniqueness checks; the username and the
+        # email can each be taken by a different row, so look at every match
+        duplicates = db.session.query(User.username, User.email).filter(
+            or_(User.username == username, User.email == email)
+        ).all()
+
+        if any(row.username == username for row in duplicates):
             flash('Username already exists', 'error')
             return redirect(url_for('register'))
 
-        if User.query.filter_by(email=email).first():
+        if duplicates:
             flash('Email already registered', 'error')
             return redirect(url_for('register'))
 
@@ -122,7 +244,7 @@ def register():
             username=username,
             email=email,
             password=hashed_password,
-            verification_token=verification_token
+            verification_token_hash=hash_token(verification_token)
         )
 
         db.session.add(new_user)
@@ -144,7 +266,7 @@ def login():
 
         user = User.query.filter_by(email=email).first()
 
-        if user and bcrypt.check_password_hash(user.password, password):
+        if user and check_login(user, password):
             if not user.is_verified:
                 flash('Please verify your email before logging in.', 'warning')
                 return redirect(url_for('login'))
@@ -160,12 +282,13 @@ def login():
 
 @app.route('/verify/<token>')
 def verify_email(token):
-    user = User.query.filter_by(verification_token=token).first()
+    user = User.query.filter_by(verification_token_hash=hash_token(token)).first()
 
     if user:
         user.is_verified = True
-        user.verification_token = None
+        user.verification_token_hash = None
         db.session.commit()
+        forget_cached_user(user.id)
         flash('Email verified successfully! You can now log in.', 'success')
     else:
         flash('Invalid verification token.', 'error')
@@ -174,17 +297,20 @@ def verify_email(token):
 
 @app.route('/dashboard')
 def dashboard():
-    if 'user_id' not in session:
+    if g.user is None:
         return redirect(url_for('login'))
 
-    user = User.query.get(session['user_id'])
-    emails = ReceivedEmail.query.filter_by(user_id=user.id).order_by(ReceivedEmail.received_at.desc()).limit(10).all()
+    user = g.user
+    # The dashboard shows a preview of each body, so load it with the rows
+    emails = ReceivedEmail.query.options(undefer(ReceivedEmail.body)).filter_by(
+        user_id=user.id
+    ).order_by(ReceivedEmail.received_at.desc()).limit(10).all()
 
     return render_template('dashboard.html', user=user, emails=emails)
 
 @app.route('/compose', methods=['GET', 'POST'])
 def compose_email():
-    if 'user_id' not in session:
+    if g.user is None:
         return redirect(url_for('login'))
 
     if request.method == 'POST':
@@ -192,7 +318,7 @@ def compose_email():
         subject = request.form['subject']
         body = request.form['body']
 
-        user = User.query.get(session['user_id'])
+        user = g.user
 
         # Save sent email
         sent_email = EmailMessage(
@@ -204,12 +330,10 @@ def compose_email():
         db.session.add(sent_email)
         db.session.commit()
 
-        # Send email (in production, use proper SMTP)
-        try:
-            send_email(recipient, subject, body, user.email)
-            flash('Email sent successfully!', 'success')
-        except Exception as e:
-            flash(f'Email saved but sending failed: {str(e)}', 'warning')
+        # Send email in the background (in production, use proper SMTP)
+        outgoing_mail.put((sent_email.id, recipient, subject, body, user.email))
+        mail_executor.submit(flush_outgoing_mail)
+        flash('Email queued for sending!', 'success')
 
         return redirect(url_for('dashboard'))
 
@@ -217,25 +341,34 @@ def compose_email():
 
 @app.route('/inbox')
 def inbox():
-    if 'user_id' not in session:
+    if g.user is None:
         return redirect(url_for('login'))
 
-    user = User.query.get(session['user_id'])
-    emails = ReceivedEmail.query.filter_by(user_id=user.id).order_by(ReceivedEmail.received_at.desc()).all()
+    user = g.user
+    # The listing never shows bodies, so only fetch the columns it renders
+    emails = ReceivedEmail.query.with_entities(
+        ReceivedEmail.id,
+        ReceivedEmail.sender_email,
+        ReceivedEmail.subject,
+        ReceivedEmail.received_at,
+        ReceivedEmail.is_read
+    ).filter_by(user_id=user.id).order_by(ReceivedEmail.received_at.desc()).all()
 
     return render_template('inbox.html', user=user, emails=emails)
 
 @app.route('/email/<int:email_id>')
 def view_email(email_id):
-    if 'user_id' not in session:
+    if g.user is None:
         return redirect(url_for('login'))
 
-    user = User.query.get(session['user_id'])
-    email = ReceivedEmail.query.filter_by(id=email_id, user_id=user.id).first()
+    user = g.user
+    email = ReceivedEmail.query.options(undefer(ReceivedEmail.body)).filter_by(id=email_id, user_id=user.id).first()
 
     if email:
-        email.is_read = True
-        db.session.commit()
+        if not email.is_read:
+            email.is_read = True
+            db.session.commit()
+            invalidate_unread_count(user.id)
         return render_template('view_email.html', user=user, email=email)
 
     flash('Email not found', 'error')
@@ -249,54 +382,272 @@ def logout():
 
 @app.route('/api/emails/unread')
 def get_unread_count():
-    if 'user_id' not in session:
+    if g.user is None:
         return jsonify({'count': 0})
 
-    count = ReceivedEmail.query.filter_by(user_id=session['user_id'], is_read=False).count()
-    return jsonify({'count': count})
+    response = jsonify({'count': count_unread(g.user.id)})
+    # Lets the browser coalesce rapid polling
+    response.headers['Cache-Control'] = 'private, max-age=5'
+    return response
+
+@app.route('/api/emails/<int:email_id>/status')
+def get_email_status(email_id):
+    if g.user is None:
+        return jsonify({'status': None}), 401
+
+    sent_email = EmailMessage.query.filter_by(id=email_id, sender_id=g.user.id).first()
+    if sent_email is None:
+        return jsonify({'status': None}), 404
+    return jsonify({'status': sent_email.status})
 
 # Utility functions
+def hash_token(token):
+    """Return the stored form of a verification token"""
+    return hashlib.sha256(token.encode()).digest()
+
+def get_current_user():
+    """Return the logged-in user, served from the Redis cache when possible"""
+    user_id = session.get('user_id')
+    if user_id is None:
+        return None
+
+    if redis_client is not None:
+        cached = redis_client.get(f"user:{user_id}")
+        if cached is not None:
+            # Detached snapshot for reading only; never add it to the session
+            return User(**json.loads(cached))
+
+    user = db.session.get(User, user_id)
+    if user is not None and redis_client is not None:
+        redis_client.setex(f"user:{user_id}", USER_CACHE_TTL, json.dumps({
+            'id': user.id,
+            'username': user.username,
+            'email': user.email,
+            'is_verified': user.is_verified
+        }))
+    return user
+
+def forget_cached_user(user_id):
+    """Drop a user's cached row after it changes"""
+    if redis_client is not None:
+        redis_client.delete(f"user:{user_id}")
+
+def count_unread(user_id):
+    """Return a user's unread email count, served from Redis when possible"""
+    key = f"unread:{user_id}"
+    if redis_client is not None:
+        cached = redis_client.get(key)
+        if cached is not None:
+            return int(cached)
+
+    count = ReceivedEmail.query.filter_by(user_id=user_id, is_read=False).count()
+    if redis_client is not None:
+        redis_client.set(key, count)
+    return count
+
+def invalidate_unread_count(user_id):
+    """Drop a user's cached unread count after their inbox changes"""
+    if redis_client is not None:
+        redis_client.delete(f"unread:{user_id}")
+
+def login_cache_key(user, password):
+    """HMAC of the credentials, bound to the stored hash so a new password misses"""
+    message = b'|'.join([
+        user.email.encode(),
+        hashlib.sha256(password.encode()).digest(),
+        user.password.encode()
+    ])
+    return hmac.new(app.config['SECRET_KEY'].encode(), message, 'sha256').hexdigest()
+
+def check_login(user, password):
+    """Check a password, skipping bcrypt for recently verified credentials"""
+    key = login_cache_key(user, password)
+    now = time.monotonic()
+
+    if redis_client is not None:
+        if redis_client.exists(f"login:{key}"):
+            return True
+    elif _login_cache.get(key, 0) > now:
+        return True
+
+    if not bcrypt.check_password_hash(user.password, password):
+        return False
+
+    if redis_client is not None:
+        redis_client.setex(f"login:{key}", LOGIN_CACHE_TTL, 1)
+    else:
+        if len(_login_cache) >= LOGIN_CACHE_MAX:
+            _login_cache.clear()
+        _login_cache[key] = now + LOGIN_CACHE_TTL
+    return True
+
+def ensure_schema():
+    """Create the tables unless the stored schema version is already current"""
+    with db.engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS _schema_meta (name VARCHAR(64) PRIMARY KEY, value VARCHAR(64))"
+        ))
+        row = conn.execute(text("SELECT value FROM _schema_meta WHERE name = 'version'")).first()
+
+    if row is not None and row[0] == str(SCHEMA_VERSION):
+        return False
+
+    db.create_all()
+    # create_all skips tables that already exist, so add any new columns
+    inspector = inspect(db.engine)
+    with db.engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    column_type = column.type.compile(db.engine.dialect)
+                    conn.execute(text(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'))
+
+        # Databases from before tokens were hashed keep pending tokens in plaintext
+        if 'verification_token' in {column['name'] for column in inspector.get_columns('user')}:
+            pending = conn.execute(text(
+                'SELECT id, verification_token FROM "user" WHERE verification_token IS NOT NULL'
+            )).all()
+            for user_id, token in pending:
+                conn.execute(
+                    text('UPDATE "user" SET verification_token_hash = :hash, verification_token = NULL WHERE id = :id'),
+                    {'hash': hash_token(token), 'id': user_id}
+                )
+
+        # SQLite cannot change a column's default in place, so rebuild tables
+        # whose stored columns are missing a server default the model declares
+        for table in db.metadata.sorted_tables:
+            stored = {column['name']: column for column in inspect(conn).get_columns(table.name)}
+            if any(column.server_default is not None and stored[column.name]['default'] is None
+                   for column in table.columns):
+                rebuild_table(conn, table, stored)
+
+    # ...and likewise any new indexes
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(db.engine, checkfirst=True)
+
+    with db.engine.begin() as conn:
+        conn.execute(text("PRAGMA optimize"))
+        conn.execute(text("DELETE FROM _schema_meta WHERE name = 'version'"))
+        conn.execute(
+            text("INSERT INTO _schema_meta (name, value) VALUES ('version', :version)"),
+            {'version': str(SCHEMA_VERSION)}
+        )
+    return True
+
+def rebuild_table(conn, table, stored_columns):
+    """Recreate a table from the model and copy its rows across"""
+    old_name = f'_old_{table.name}'
+    shared = ', '.join(f'"{column.name}"' for column in table.columns if column.name in stored_columns)
+
+    # Keep other tables' foreign keys pointing at the original name while renaming
+    conn.execute(text("PRAGMA legacy_alter_table=ON"))
+    for index in inspect(conn).get_indexes(table.name):
+        conn.execute(text(f'DROP INDEX "{index["name"]}"'))
+    conn.execute(text(f'ALTER TABLE "{table.name}" RENAME TO "{old_name}"'))
+    table.create(conn)
+    conn.execute(text(f'INSERT INTO "{table.name}" ({shared}) SELECT {shared} FROM "{old_name}"'))
+    conn.execute(text(f'DROP TABLE "{old_name}"'))
+    conn.execute(text("PRAGMA legacy_alter_table=OFF"))
+
 def send_verification_email(email, token):
-    """Send email verification link"""
-    try:
-        msg = Message('Verify Your Email',
-                     sender=app.config['MAIL_DEFAULT_SENDER'],
-                     recipients=[email])
+    """Queue the email verification link"""
+    # url_for needs the request context, so build the link before handing off
+    verification_url = url_for('verify_email', token=token, _external=True)
+    body = f'Please click the following link to verify your email: {verification_url}'
+
+    # Untracked (no EmailMessage row), but sent and suppressed like any other mail
+    outgoing_mail.put((None, email, 'Verify Your Email', body, app.config['MAIL_DEFAULT_SENDER']))
+    mail_executor.submit(flush_outgoing_mail)
 
-        verification_url = url_for('verify_email', token=token, _external=True)
-        msg.body = f'Please click the following link to verify your email: {verification_url}'
+def send_emails(messages):
+    """Send (recipient, subject, body, sender_email) tuples over one SMTP connection
 
+    Returns one error string, or None on success, per message.
+    """
+    if app.config['MAIL_SUPPRESS_SEND']:
         # For local testing, we'll simulate sending
-        print(f"Verification email would be sent to {email} with token: {token}")
-        print(f"Verification URL: {verification_url}")
+        for recipient, subject, body, sender_email in messages:
+            print(f"Email would be sent from {sender_email} to {recipient}")
+            print(f"Subject: {subject}")
+            print(f"Body: {body}")
+        return [None] * len(messages)
+
+    import smtplib
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+
+    # Every message goes through the configured relay, so the TLS and AUTH
+    # handshake is paid once per batch rather than once per message
+    errors = []
+    server = smtplib.SMTP(app.config['MAIL_SERVER'], app.config['MAIL_PORT'])
+    try:
+        server.starttls()
+        server.login(app.config['MAIL_USERNAME'], app.config['MAIL_PASSWORD'])
+
+        for recipient, subject, body, sender_email in messages:
+            msg = MIMEMultipart()
+            msg['From'] = sender_email
+            msg['To'] = recipient
+            msg['Subject'] = subject
+            msg.attach(MIMEText(body, 'plain'))
+
+            try:
+                server.sendmail(sender_email, recipient, msg.as_string())
+                errors.append(None)
+            except smtplib.SMTPException as e:
+                errors.append(str(e))
+    finally:
+        try:
+            server.quit()
+        except smtplib.SMTPException:
+            pass
 
-        # In production: mail.send(msg)
-    except Exception as e:
-        print(f"Failed to send verification email: {e}")
+    return errors
 
-def send_email(recipient, subject, body, sender_email):
-    """Send email using SMTP"""
-    try:
-        # For local testing, we'll simulate sending
-        print(f"Email would be sent from {sender_email} to {recipient}")
-        print(f"Subject: {subject}")
-        print(f"Body: {body}")
-
-        # In production, use proper SMTP:
-        # msg = MIMEMultipart()
-        # msg['From'] = sender_email
-        # msg['To'] = recipient
-        # msg['Subject'] = subject
-        # msg.attach(MIMEText(body, 'plain'))
-        #
-        # server = smtplib.SMTP(app.config['MAIL_SERVER'], app.config['MAIL_PORT'])
-        # server.starttls()
-        # server.login(app.config['MAIL_USERNAME'], app.config['MAIL_PASSWORD'])
-        # server.sendmail(sender_email, recipient, msg.as_string())
-        # server.quit()
+def flush_outgoing_mail():
+    """Send every queued email from a mail worker and record the outcomes"""
+    with mail_flush_lock:
+        batch = []
+        while True:
+            try:
+                batch.append(outgoing_mail.get_nowait())
+            except queue.Empty:
+                break
 
-    except Exception as e:
-        raise Exception(f"Failed to send email: {str(e)}")
+        if not batch:
+            return
+
+        try:
+            errors = send_emails([item[1:] for item in batch])
+        except Exception as e:
+            errors = [str(e)] * len(batch)
+
+        sent_ids = []
+        failed_ids = []
+        for item, error in zip(batch, errors):
+            email_id = item[0]
+            if error:
+                print(f"Failed to send email {email_id or item[1]}: {error}")
+            if email_id is None:
+                continue
+            if error:
+                failed_ids.append(email_id)
+            else:
+                sent_ids.append(email_id)
+
+        with app.app_context():
+            for status, ids in (('sent', sent_ids), ('failed', failed_ids)):
+                if ids:
+                    EmailMessage.query.filter(EmailMessage.id.in_(ids)).update(
+                        {'status': status}, synchronize_session=False
+                    )
+            db.session.commit()
+
+# bcrypt hash of the test account's password 'password', precomputed so
+# seeding a fresh database does no key-derivation work
+SAMPLE_PASSWORD_HASH = '$2b$12$Cqn3UE2FsIL8AVnrIxbAleaN5gsqnktA4/in8m3cvXpPDyd7P8vC2'
 
 def create_sample_emails():
     """Create sample emails for testing"""
@@ -304,11 +655,10 @@ def create_sample_emails():
         # Create a test user if none exists
         test_user = User.query.filter_by(email='test@example.com').first()
         if not test_user:
-            hashed_password = bcrypt.generate_password_hash('password').decode('utf-8')
             test_user = User(
                 username='testuser',
                 email='test@example.com',
-                password=hashed_password,
+                password=SAMPLE_PASSWORD_HASH,
                 is_verified=True
             )
             db.session.add(test_user)
@@ -328,46 +678,64 @@ def create_sample_emails():
             }
         ]
 
-        for email_data in sample_emails:
-            existing = ReceivedEmail.query.filter_by(
-                user_id=test_user.id,
-                sender_email=email_data['sender_email'],
-                subject=email_data['subject']
-            ).first()
-
-            if not existing:
-                received_email = ReceivedEmail(
-                    user_id=test_user.id,
-                    sender_email=email_data['sender_email'],
-                    subject=email_data['subject'],
-                    body=email_data['body']
-                )
-                db.session.add(received_email)
+        # One query for what is already seeded, one bulk INSERT for the rest
+        existing = {
+            (row.sender_email, row.subject)
+            for row in db.session.query(ReceivedEmail.sender_email, ReceivedEmail.subject).filter_by(user_id=test_user.id)
+        }
+        to_insert = [
+            dict(user_id=test_user.id, **email_data)
+            for email_data in sample_emails
+            if (email_data['sender_email'], email_data['subject']) not in existing
+        ]
+        if not to_insert:
+            return
 
+        db.session.bulk_insert_mappings(ReceivedEmail, to_insert)
         db.session.commit()
+        invalidate_unread_count(test_user.id)
 
 # Template filters
+@lru_cache(maxsize=4096)
+def format_minute(value):
+    """Format a minute-truncated datetime; rows in the same minute share the result"""
+    return value.strftime('%Y-%m-%d %H:%M')
+
 @app.template_filter('datetime')
 def format_datetime(value):
-    if isinstance(value, str):
-        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
-    return value.strftime('%Y-%m-%d %H:%M')
+    return format_minute(value.replace(second=0, microsecond=0))
 
-# Initialize database and create sample data when the module is imported
-print("Starting database initialization...")
-try:
-    with app.app_context():
-        print("Creating database tables...")
-        db.create_all()
-        print("Creating sample emails...")
-        create_sample_emails()
+def is_database_ready():
+    """Check for the marker left by a completed initialization of this schema"""
+    try:
+        with open(ready_marker) as f:
+            return f.read().strip() == str(SCHEMA_VERSION) and os.path.exists(db_path)
+    except OSError:
+        return False
+
+# Initialize database and create sample data when the module is imported,
+# unless a previous worker already did so for the current schema
+ready_marker = db_path + '.ready'
+if is_database_ready():
+    print("Database already initialized")
+else:
+    print("Starting database initialization...")
+    try:
+        with app.app_context():
+            print("Creating database tables...")
+            if not ensure_schema():
+                print("Database schema is up to date")
+            print("Creating sample emails...")
+            create_sample_emails()
+        with open(ready_marker, 'w') as f:
+            f.write(str(SCHEMA_VERSION))
         print("Database initialized successfully")
-except Exception as e:
-    print(f"Database initialization error: {e}")
-    import traceback
-    print(f"Traceback: {traceback.format_exc()}")
-    # Continue anyway - the app should still work
-    print("Continuing without database initialization...")
+    except Exception as e:
+        print(f"Database initialization error: {e}")
+        import traceback
+        print(f"Traceback: {traceback.format_exc()}")
+        # Continue anyway - the app should still work
+        print("Continuing without database initialization...")
 
 if __name__ == '__main__':
     print("Email Server starting on http://localhost:5000")
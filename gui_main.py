@@ -4,36 +4,280 @@ Modern GUI Interface for Discord Account Management
 Features: 1920x1080 resolution, Chrome blue/black/white theme, Embedded Discord browser
 """
 
+import asyncio
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, font
-import subprocess
-import sys
 import os
-import webbrowser
-import threading
-import time
-from PIL import Image, ImageTk
-import requests
-from io import BytesIO
-from urllib.parse import urlparse, urljoin
-import json
 import re
+from collections import OrderedDict, deque
+from functools import lru_cache, partial
+from itertools import chain
+from types import SimpleNamespace
+
+from health_utils import probe_health
+
+# Chrome-style color scheme
+PALETTE = SimpleNamespace(
+    bg_dark='#0a0a0a',
+    bg_medium='#1a1a1a',
+    bg_light='#2a2a2a',
+    accent_blue='#4285f4',
+    accent_blue_dark='#3367d6',
+    text_white='#ffffff',
+    text_gray='#cccccc',
+    chrome_blue='#1a73e8',
+    chrome_blue_hover='#1557b0'
+)
+
+# Status names; callers pass these lowercase constants to status_color
+ONLINE, READY, OFFLINE, CONNECTED, ERROR, AVAILABLE = (
+    'online', 'ready', 'offline', 'connected', 'error', 'available')
+
+STATUS_COLORS = {
+    ONLINE: '#4CAF50',
+    READY: '#2196F3',
+    CONNECTED: '#4CAF50',
+    OFFLINE: '#f44336',
+    ERROR: '#f44336'
+}
+
+def status_color(status, default):
+    """Look up the indicator color for a status name"""
+    return STATUS_COLORS.get(status, default)
+
+# Emoji and symbols used in section captions and button labels
+ICON_GLYPHS = "🌐📧🎮📊🔄🏠🔒←→✕─"
+
+# Tag setup for the browser's text widgets, run as one script per widget;
+# fonts are filled in with the names of the browser's Font objects
+CONTENT_TAGS_SCRIPT = """\
+%(w)s tag configure title -font %(title_font)s -foreground %(chrome_blue)s
+%(w)s tag configure heading -font %(heading_font)s -foreground %(text_white)s
+%(w)s tag configure link -foreground %(chrome_blue)s -underline 1
+%(w)s tag configure button -background %(chrome_blue)s -foreground %(text_white)s -relief raised
+%(w)s tag configure input -background %(bg_light)s -foreground %(text_white)s
+"""
+
+BRAVE_EXE = r"BraveSoftware\Brave-Browser\Application\brave.exe"
+
+@lru_cache(maxsize=1)
+def find_brave_path():
+    """Return the first Brave install found in the usual locations, or None"""
+    roots = [os.environ.get(name) for name in ('PROGRAMFILES', 'PROGRAMFILES(X86)', 'LOCALAPPDATA')]
+    candidates = [os.path.join(root, BRAVE_EXE) for root in roots if root]
+    candidates.append(os.path.join(r"C:\Program Files", BRAVE_EXE))
+    found = next((path for path in candidates if os.path.exists(path)), None)
+    if not found:
+        import shutil
+        found = shutil.which("brave") or shutil.which("brave-browser")
+    return found
+
+@lru_cache(maxsize=1)
+def system_browser():
+    """Return the default browser controller, looked up once on first use"""
+    import webbrowser
+    return webbrowser.get()
+
+def open_url(url):
+    """Open a URL in a new tab of the default browser"""
+    import webbrowser
+    try:
+        browser = system_browser()
+    except webbrowser.Error:
+        return False
+    return browser.open(url, new=2)
+
+def add_buttons(parent, specs, pack_options, button_class=tk.Button, **options):
+    """Create a button per (text, command) spec, then pack them together"""
+    buttons = [button_class(parent, text=text, command=command, **options) for text, command in specs]
+    for button in buttons:
+        button.pack(**pack_options)
+    return buttons
+
+# Title underlines for the browser pages
+SEP_20 = "=" * 20 + "\n\n"
+SEP_30 = "=" * 30 + "\n\n"
+SEP_35 = "=" * 35 + "\n\n"
+SEP_50 = "=" * 50 + "\n\n"
+
+# The built-in Discord pages as (text, tags) spans, assembled once at import
+HOME_PAGE = (
+    ("Discord\n", "title"),
+    (SEP_50, ""),
+    ("🎮 Free Voice and Text Chat for Gamers\n\n", "heading"),
+    ("Discord is the easiest way to communicate over voice, video, and text. "
+     "Chat, hang out, and stay close with your friends and communities.\n\n", ""),
+    # Login button
+    ("[ LOGIN ]", "button go_login"),
+    (" ", ""),
+    ("[ REGISTER ]", "button go_register"),
+    ("\n\n", ""),
+    # Features
+    ("✨ Features:\n", "heading"),
+    ("• Create servers for your communities\n"
+     "• Voice channels for talking\n"
+     "• Text channels for messaging\n"
+     "• Screen sharing and video calls\n"
+     "• Custom emojis and roles\n"
+     "• Bot integrations\n\n"
+     "📱 Available on: Windows, macOS, Linux, iOS, Android, Web\n\n"
+     "🌐 ", ""),
+    ("Download Discord", "link go_download"),
+    (" | ", ""),
+    ("Open in Browser", "link open_external"),
+    ("\n\n", ""),
+)
+
+LOGIN_PAGE = (
+    ("Discord - Login\n", "title"),
+    (SEP_30, ""),
+    ("Welcome back!\n\n", "heading"),
+    ("Email: ____________________\n"
+     "Password: _________________\n\n", ""),
+    ("[ LOGIN ]", "button submit_login"),
+    (" ", ""),
+    ("[ Forgot Password? ]", "link go_forgot"),
+    ("\n\nNew to Discord? ", ""),
+    ("Register here", "link go_register"),
+    # QR Code login option
+    ("\n\n📱 Or login with QR code\n", ""),
+    ("[📷 Scan QR Code]", "button scan_qr"),
+)
+
+REGISTER_PAGE = (
+    ("Discord - Create Account\n", "title"),
+    (SEP_35, ""),
+    ("Create your Discord account\n\n", "heading"),
+    ("Email: ____________________\n"
+     "Username: _________________\n"
+     "Password: _________________\n"
+     "Date of Birth: __/__/____\n\n", ""),
+    ("[ CONTINUE ]", "button submit_register"),
+    ("\n\nBy registering, you agree to Discord's ", ""),
+    ("Terms of Service", "link go_terms"),
+    (" and ", ""),
+    ("Privacy Policy", "link go_privacy"),
+    ("\n\nAlready have an account? ", ""),
+    ("Login here", "link go_login"),
+)
+
+APP_PAGE = (
+    ("Discord - App\n", "title"),
+    (SEP_20, ""),
+    ("⚠️ Note: This is a simulated Discord interface.\n"
+     "For full Discord functionality, please use the official Discord application.\n\n", ""),
+    # Server list
+    ("📋 Servers:\n", "heading"),
+    ("• My Server\n• Gaming Hub\n• Study Group\n• Music Lounge\n", ""),
+    ("\n💬 Channels:\n", "heading"),
+    ("• # general\n• # gaming\n• # music\n• # memes\n", ""),
+    ("\n👥 Online Users:\n", "heading"),
+    ("• User1 (Online)\n• User2 (Online)\n• User3 (Away)\n• User4 (Offline)\n", ""),
+)
 
 class EmbeddedDiscordBrowser:
     """Custom embedded browser for Discord operations within the GUI"""
 
-    def __init__(self, parent, colors):
+    # Discord URL patterns, tried in order, mapped to their page builders
+    ROUTES = (
+        (re.compile(r'/login|discord\.com$'), 'display_discord_login'),
+        (re.compile(r'/register'), 'display_discord_register'),
+        (re.compile(r'/app'), 'display_discord_app'),
+    )
+
+    # Clickable spans carry one of these action tags next to "link" or
+    # "button"; a click runs the mapped (method name, *args)
+    ACTIONS = {
+        'go_home': ('load_discord_page', "https://discord.com"),
+        'go_login': ('load_discord_page', "https://discord.com/login"),
+        'go_register': ('load_discord_page', "https://discord.com/register"),
+        'go_download': ('load_discord_page', "https://discord.com/download"),
+        'go_terms': ('load_discord_page', "https://discord.com/terms"),
+        'go_privacy': ('load_discord_page', "https://discord.com/privacy"),
+        'go_forgot': ('load_discord_page', "https://discord.com/forgot"),
+        'open_external': ('open_externally',),
+        'submit_login': ('submit_login',),
+        'scan_qr': ('scan_qr_code',),
+        'submit_register': ('submit_registration',),
+    }
+
+    # Most pages kept in each direction of the history
+    HISTORY_LIMIT = 256
+
+    # Most rendered pages kept; the least recently shown are dropped first
+    PAGE_CACHE_LIMIT = 256
+
+    # Navigation buttons as (symbol, method name, tooltip)
+    NAV_BUTTONS = (
+        ("←", 'go_back', "Back"),
+        ("→", 'go_forward', "Forward"),
+        ("🔄", 'refresh', "Refresh"),
+        ("🏠", 'go_home', "Home"),
+    )
+
+    def __init__(self, parent, colors, loop, fonts):
         self.parent = parent
         self.colors = colors
+        # The GUI's shared font objects, used by every browser widget and text tag
+        self.fonts = fonts
+        # The GUI's asyncio loop, pumped from the Tk loop; fetches run on its executor
+        self.loop = loop
         self.current_url = "https://discord.com"
-        self.history = []
-        self.history_index = -1
+        # Two-stack history: pages behind the current one and pages ahead of it
+        self.back_stack = deque(maxlen=self.HISTORY_LIMIT)
+        self.forward_stack = deque(maxlen=self.HISTORY_LIMIT)
         self.cookies = {}
-        self.session = requests.Session()
+
+        # Rendered page parts per URL, reused on back/forward, in least recently shown order
+        self.page_cache = OrderedDict()
+        self.display_scheduled = False
+        self.page_dirty = True
+        self._session = None
 
         # Create browser UI
         self.create_browser_ui()
 
+    @property
+    def session(self):
+        """HTTP session, created on first use so requests is only imported when needed"""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            # One pooled adapter keeps connections alive across navigations
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20,
+                                  max_retries=Retry(total=2, backoff_factor=0.3))
+            self._session = requests.Session()
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
+            self._session.headers['User-Agent'] = 'RealLifeAITools-Browser/1.0'
+        return self._session
+
+    def fetch(self, url):
+        """Fetch a URL over the pooled session"""
+        return self.session.get(url, timeout=5)
+
+    def request(self, url, callback):
+        """Fetch a URL off the Tk thread, then call callback(url, response, error) on it"""
+        return self.loop.create_task(self.fetch_async(url, callback))
+
+    async def fetch_async(self, url, callback):
+        """Run the blocking fetch on the loop's executor and hand the result to callback"""
+        response = error = None
+        try:
+            response = await self.loop.run_in_executor(None, self.fetch, url)
+        except Exception as e:
+            error = e
+        # Coroutines resume on the Tk thread, where the loop is pumped
+        callback(url, response, error)
+
+    def close(self):
+        """Release the HTTP session's pooled connections"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     def create_browser_ui(self):
         """Create the browser interface"""
         # Browser container
@@ -50,47 +294,43 @@ class EmbeddedDiscordBrowser:
 
     def create_navigation_bar(self):
         """Create browser navigation bar"""
-        nav_frame = tk.Frame(self.browser_frame, bg=self.colors['bg_dark'], height=50)
+        # Gridded with a minimum row height so the bar keeps its 50px without
+        # turning off geometry propagation
+        nav_frame = tk.Frame(self.browser_frame, bg=self.colors['bg_dark'])
         nav_frame.pack(fill=tk.X, pady=(0, 5))
-        nav_frame.pack_propagate(False)
+        nav_frame.rowconfigure(0, minsize=50)
+        nav_frame.columnconfigure(1, weight=1)
 
         # Navigation buttons
         button_frame = tk.Frame(nav_frame, bg=self.colors['bg_dark'])
-        button_frame.pack(side=tk.LEFT, padx=10)
+        button_frame.grid(row=0, column=0, padx=10)
 
-        nav_buttons = [
-            ("←", self.go_back, "Back"),
-            ("→", self.go_forward, "Forward"),
-            ("🔄", self.refresh, "Refresh"),
-            ("🏠", self.go_home, "Home")
-        ]
+        buttons = add_buttons(button_frame, ((symbol, getattr(self, name)) for symbol, name, _ in self.NAV_BUTTONS),
+                              {'side': tk.LEFT, 'padx': (0, 5)},
+                              font=self.fonts['subtitle'],
+                              bg=self.colors['bg_dark'],
+                              fg=self.colors['text_white'],
+                              borderwidth=0,
+                              padx=8, pady=5)
 
         self.nav_buttons = {}
-        for symbol, cmd, tooltip in nav_buttons:
-            btn = tk.Button(button_frame, text=symbol,
-                           font=('Segoe UI', 12),
-                           bg=self.colors['bg_dark'],
-                           fg=self.colors['text_white'],
-                           borderwidth=0,
-                           padx=8, pady=5,
-                           command=cmd)
-            btn.pack(side=tk.LEFT, padx=(0, 5))
+        for btn, (_, _, tooltip) in zip(buttons, self.NAV_BUTTONS):
             btn.bind("<Enter>", lambda e, t=tooltip: self.show_tooltip(t))
             btn.bind("<Leave>", lambda e: self.hide_tooltip())
             self.nav_buttons[tooltip.lower()] = btn
 
         # URL bar
         url_frame = tk.Frame(nav_frame, bg=self.colors['bg_dark'])
-        url_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(10, 10))
+        url_frame.grid(row=0, column=1, sticky='ew', padx=(10, 10))
 
         url_label = tk.Label(url_frame, text="🔒",
-                            font=('Segoe UI', 10),
+                            font=self.fonts['body'],
                             fg=self.colors['text_white'],
                             bg=self.colors['bg_dark'])
         url_label.pack(side=tk.LEFT, padx=(0, 5))
 
         self.url_entry = tk.Entry(url_frame,
-                                 font=('Segoe UI', 10),
+                                 font=self.fonts['body'],
                                  bg=self.colors['bg_light'],
                                  fg=self.colors['text_white'],
                                  insertbackground=self.colors['text_white'],
@@ -101,7 +341,7 @@ class EmbeddedDiscordBrowser:
         self.url_entry.bind("<Return>", self.navigate_to_url)
 
         go_btn = tk.Button(url_frame, text="Go",
-                          font=('Segoe UI', 10, 'bold'),
+                          font=self.fonts['body_bold'],
                           bg=self.colors['chrome_blue'],
                           fg=self.colors['text_white'],
                           borderwidth=0,
@@ -114,11 +354,21 @@ class EmbeddedDiscordBrowser:
         content_frame = tk.Frame(self.browser_frame, bg=self.colors['bg_light'])
         content_frame.pack(fill=tk.BOTH, expand=True)
 
-        # Create a scrolled text widget for content display
-        self.content_text = scrolledtext.ScrolledText(
-            content_frame,
+        # Two identical text widgets: pages are built in the hidden one and
+        # swapped in whole, so the visible one never shows a half-built page
+        self.content_text = self.create_content_text(content_frame)
+        self.back_text = self.create_content_text(content_frame)
+        self.content_text.pack(fill=tk.BOTH, expand=True)
+
+        # Initial Discord page load
+        self.load_discord_page()
+
+    def create_content_text(self, parent):
+        """Create a scrolled text widget for content display"""
+        text = scrolledtext.ScrolledText(
+            parent,
             wrap=tk.WORD,
-            font=('Consolas', 10),
+            font=self.fonts['content'],
             bg=self.colors['bg_dark'],
             fg=self.colors['text_white'],
             insertbackground=self.colors['text_white'],
@@ -128,278 +378,184 @@ class EmbeddedDiscordBrowser:
             padx=10, pady=10
         )
 
-        # Configure tags for different content types
-        self.content_text.tag_configure("title", font=('Segoe UI', 16, 'bold'), foreground=self.colors['chrome_blue'])
-        self.content_text.tag_configure("heading", font=('Segoe UI', 14, 'bold'), foreground=self.colors['text_white'])
-        self.content_text.tag_configure("link", foreground=self.colors['chrome_blue'], underline=True)
-        self.content_text.tag_configure("button", background=self.colors['chrome_blue'], foreground=self.colors['text_white'], relief=tk.RAISED)
-        self.content_text.tag_configure("input", background=self.colors['bg_light'], foreground=self.colors['text_white'])
-
-        self.content_text.pack(fill=tk.BOTH, expand=True)
-
-        # Bind link clicking
-        self.content_text.tag_bind("link", "<Button-1>", self.handle_link_click)
-        self.content_text.tag_bind("link", "<Enter>", lambda e: self.content_text.config(cursor="hand2"))
-        self.content_text.tag_bind("link", "<Leave>", lambda e: self.content_text.config(cursor=""))
+        # Configure tags for different content types in one Tcl evaluation
+        text.tk.eval(CONTENT_TAGS_SCRIPT % dict(self.colors, w=text,
+                                                title_font=self.fonts['heading'],
+                                                heading_font=self.fonts['section']))
 
-        # Initial Discord page load
-        self.load_discord_page()
+        # Links and buttons dispatch on the action tag of the clicked span
+        text.tag_bind("link", "<Button-1>", self.handle_action_click)
+        text.tag_bind("button", "<Button-1>", self.handle_action_click)
+        text.tag_bind("link", "<Enter>", lambda e: text.config(cursor="hand2"))
+        text.tag_bind("link", "<Leave>", lambda e: text.config(cursor=""))
+        return text
 
     def create_browser_status_bar(self):
         """Create browser status bar"""
-        self.browser_status_frame = tk.Frame(self.browser_frame, bg=self.colors['bg_dark'], height=25)
+        self.browser_status_frame = tk.Frame(self.browser_frame, bg=self.colors['bg_dark'])
         self.browser_status_frame.pack(fill=tk.X)
-        self.browser_status_frame.pack_propagate(False)
+        self.browser_status_frame.rowconfigure(0, minsize=25)
+        self.browser_status_frame.columnconfigure(0, weight=1)
 
         self.browser_status_label = tk.Label(
             self.browser_status_frame,
             text="Ready - Discord Browser",
-            font=('Segoe UI', 8),
+            font=self.fonts['small'],
             fg=self.colors['text_gray'],
             bg=self.colors['bg_dark'],
             anchor='w'
         )
-        self.browser_status_label.pack(fill=tk.X, padx=10)
+        self.browser_status_label.grid(row=0, column=0, sticky='ew', padx=10)
 
     def load_discord_page(self, url=None):
         """Load Discord page content"""
+        # A new navigation starts a fresh forward branch
+        if url:
+            self.back_stack.append(self.current_url)
+            self.forward_stack.clear()
+        self.show_url(url)
+
+    def show_url(self, url=None):
+        """Make url the current page without touching history"""
+        self.page_dirty = True
         if url:
             self.current_url = url
             self.url_entry.delete(0, tk.END)
             self.url_entry.insert(0, url)
 
-        # Add to history
-        if self.history_index < len(self.history) - 1:
-            self.history = self.history[:self.history_index + 1]
-        self.history.append(self.current_url)
-        self.history_index = len(self.history) - 1
-
         # Update navigation buttons
         self.update_nav_buttons()
 
         # Load Discord-specific content
+        self.schedule_display()
+
+    def schedule_display(self):
+        """Draw the current page shortly, so a burst of navigations draws only the last one"""
+        if not self.display_scheduled:
+            self.display_scheduled = True
+            self.parent.after(30, self.flush_display)
+
+    def flush_display(self):
+        """Draw the page for the URL that is current once the burst has settled"""
+        self.display_scheduled = False
         self.display_discord_content()
 
     def display_discord_content(self):
         """Display Discord-specific content in the browser"""
+        # Build into the hidden buffer, which becomes content_text for the handlers
+        self.content_text, self.back_text = self.back_text, self.content_text
         self.content_text.delete(1.0, tk.END)
 
-        if "discord.com" in self.current_url:
-            if "/login" in self.current_url or self.current_url.endswith("discord.com"):
-                self.display_discord_login()
-            elif "/register" in self.current_url:
-                self.display_discord_register()
-            elif "/app" in self.current_url:
-                self.display_discord_app()
-            else:
-                self.display_discord_home()
+        # Pages already built for this URL are replayed without rebuilding
+        page = self.page_cache.get(self.current_url)
+        if page:
+            self.render_page(page)
+        elif "discord.com" in self.current_url:
+            display = next((name for pattern, name in self.ROUTES if pattern.search(self.current_url)),
+                           'display_discord_home')
+            getattr(self, display)()
         else:
             self.display_external_page()
 
-    def display_discord_home(self):
-        """Display Discord home page"""
-        content = """Discord - Free Voice and Text Chat for Gamers
-
-Welcome to Discord!
-
-Discord is the easiest way to communicate over voice, video, and text. Chat, hang out, and stay close with your friends and communities.
-
-"""
-
-        self.content_text.insert(tk.END, "Discord\n", "title")
-        self.content_text.insert(tk.END, "=" * 50 + "\n\n")
-
-        self.content_text.insert(tk.END, "🎮 Free Voice and Text Chat for Gamers\n\n", "heading")
-
-        self.content_text.insert(tk.END, "Discord is the easiest way to communicate over voice, video, and text. ")
-        self.content_text.insert(tk.END, "Chat, hang out, and stay close with your friends and communities.\n\n")
-
-        # Login button
-        self.content_text.insert(tk.END, "[ LOGIN ]", "button")
-        self.content_text.insert(tk.END, " ")
-        self.content_text.insert(tk.END, "[ REGISTER ]", "button")
-        self.content_text.insert(tk.END, "\n\n")
-
-        # Features
-        self.content_text.insert(tk.END, "✨ Features:\n", "heading")
-        self.content_text.insert(tk.END, "• Create servers for your communities\n")
-        self.content_text.insert(tk.END, "• Voice channels for talking\n")
-        self.content_text.insert(tk.END, "• Text channels for messaging\n")
-        self.content_text.insert(tk.END, "• Screen sharing and video calls\n")
-        self.content_text.insert(tk.END, "• Custom emojis and roles\n")
-        self.content_text.insert(tk.END, "• Bot integrations\n\n")
+        # Show the finished page in place of the old one
+        self.back_text.pack_forget()
+        self.content_text.pack(fill=tk.BOTH, expand=True)
 
-        self.content_text.insert(tk.END, "📱 Available on: Windows, macOS, Linux, iOS, Android, Web\n\n")
+        # The built-in Discord pages never change once drawn; an external
+        # page's server reply can, so it stays dirty for refresh
+        self.page_dirty = "discord.com" not in self.current_url
 
-        self.content_text.insert(tk.END, "🌐 ")
-        self.content_text.insert(tk.END, "Download Discord", "link")
-        self.content_text.insert(tk.END, " | ")
-        self.content_text.insert(tk.END, "Open in Browser", "link")
-        self.content_text.insert(tk.END, "\n\n")
+    def render_page(self, parts):
+        """Append (text, tags) parts in a single insert and keep them for the current URL"""
+        self.page_cache[self.current_url] = parts
+        self.page_cache.move_to_end(self.current_url)
+        if len(self.page_cache) > self.PAGE_CACHE_LIMIT:
+            self.page_cache.popitem(last=False)
+        self.content_text.insert(tk.END, *chain.from_iterable(parts))
 
-        # Tag bindings for buttons
-        self.content_text.tag_bind("button", "<Button-1>", self.handle_button_click)
+    def display_discord_home(self):
+        """Display Discord home page"""
+        self.render_page(HOME_PAGE)
 
     def display_discord_login(self):
         """Display Discord login page"""
-        self.content_text.insert(tk.END, "Discord - Login\n", "title")
-        self.content_text.insert(tk.END, "=" * 30 + "\n\n")
-
-        self.content_text.insert(tk.END, "Welcome back!\n\n", "heading")
-
-        self.content_text.insert(tk.END, "Email: ____________________\n")
-        self.content_text.insert(tk.END, "Password: _________________\n\n")
-
-        self.content_text.insert(tk.END, "[ LOGIN ]", "button")
-        self.content_text.insert(tk.END, " ")
-        self.content_text.insert(tk.END, "[ Forgot Password? ]", "link")
-        self.content_text.insert(tk.END, "\n\n")
-
-        self.content_text.insert(tk.END, "New to Discord? ")
-        self.content_text.insert(tk.END, "Register here", "link")
-        self.content_text.insert(tk.END, "\n\n")
-
-        # QR Code login option
-        self.content_text.insert(tk.END, "📱 Or login with QR code\n")
-        self.content_text.insert(tk.END, "[📷 Scan QR Code]", "button")
-
-        self.content_text.tag_bind("button", "<Button-1>", self.handle_login_button_click)
+        self.render_page(LOGIN_PAGE)
 
     def display_discord_register(self):
         """Display Discord registration page"""
-        self.content_text.insert(tk.END, "Discord - Create Account\n", "title")
-        self.content_text.insert(tk.END, "=" * 35 + "\n\n")
-
-        self.content_text.insert(tk.END, "Create your Discord account\n\n", "heading")
-
-        self.content_text.insert(tk.END, "Email: ____________________\n")
-        self.content_text.insert(tk.END, "Username: _________________\n")
-        self.content_text.insert(tk.END, "Password: _________________\n")
-        self.content_text.insert(tk.END, "Date of Birth: __/__/____\n\n")
-
-        self.content_text.insert(tk.END, "[ CONTINUE ]", "button")
-        self.content_text.insert(tk.END, "\n\n")
-
-        self.content_text.insert(tk.END, "By registering, you agree to Discord's ")
-        self.content_text.insert(tk.END, "Terms of Service", "link")
-        self.content_text.insert(tk.END, " and ")
-        self.content_text.insert(tk.END, "Privacy Policy", "link")
-        self.content_text.insert(tk.END, "\n\n")
-
-        self.content_text.insert(tk.END, "Already have an account? ")
-        self.content_text.insert(tk.END, "Login here", "link")
-
-        self.content_text.tag_bind("button", "<Button-1>", self.handle_register_button_click)
+        self.render_page(REGISTER_PAGE)
 
     def display_discord_app(self):
         """Display Discord app interface"""
-        self.content_text.insert(tk.END, "Discord - App\n", "title")
-        self.content_text.insert(tk.END, "=" * 20 + "\n\n")
-
-        self.content_text.insert(tk.END, "⚠️ Note: This is a simulated Discord interface.\n")
-        self.content_text.insert(tk.END, "For full Discord functionality, please use the official Discord application.\n\n")
+        self.render_page(APP_PAGE)
 
-        # Server list
-        self.content_text.insert(tk.END, "📋 Servers:\n", "heading")
-        servers = ["My Server", "Gaming Hub", "Study Group", "Music Lounge"]
-        for server in servers:
-            self.content_text.insert(tk.END, f"• {server}\n")
+    def display_external_page(self, reply=None):
+        """Display external page warning"""
+        # The page shows at once; the server's reply is filled in when it arrives
+        if reply is None:
+            reply = "Server response: loading..."
+            self.update_status(f"Loading {self.current_url}...")
+            self.request(self.current_url, self.show_external_reply)
+
+        self.render_page([
+            ("🔒 External Link\n", "title"),
+            (SEP_20, ""),
+            (f"URL: {self.current_url}\n{reply}\n\n"
+             "⚠️ This embedded browser is optimized for Discord.\n"
+             "For full web browsing, use your external browser.\n\n", ""),
+            ("[ Open in External Browser ]", "button open_external"),
+            (" ", ""),
+            ("[ Back to Discord ]", "button go_home"),
+        ])
+
+    def show_external_reply(self, url, response, error):
+        """Redraw the external page with the result of its fetch"""
+        if error is None:
+            reply = f"Server response: {response.status_code} {response.reason}"
+        else:
+            reply = f"Server response: unavailable ({error.__class__.__name__})"
+
+        # A page left before its fetch finished is fetched again on the next visit
+        self.page_cache.pop(url, None)
+        if url == self.current_url:
+            self.content_text.delete(1.0, tk.END)
+            self.display_external_page(reply)
+            self.update_status(reply)
+
+    def handle_action_click(self, event):
+        """Run the action tagged on the clicked link or button"""
+        for tag in self.content_text.tag_names(f"@{event.x},{event.y}"):
+            action = self.ACTIONS.get(tag)
+            if action:
+                method, *args = action
+                getattr(self, method)(*args)
+                break
+
+    def open_externally(self):
+        """Open the current page in the system browser"""
+        # Launching the browser can take a while, so keep it off the Tk thread
+        return self.loop.create_task(self.open_externally_async(self.current_url))
+
+    async def open_externally_async(self, url):
+        """Open url on the loop's executor and report whether a browser took it"""
+        if await self.loop.run_in_executor(None, open_url, url):
+            self.update_status("Opened in external browser")
+        else:
+            self.update_status("No external browser available")
 
-        self.content_text.insert(tk.END, "\n💬 Channels:\n", "heading")
-        channels = ["# general", "# gaming", "# music", "# memes"]
-        for channel in channels:
-            self.content_text.insert(tk.END, f"• {channel}\n")
+    def submit_login(self):
+        """Handle the login form's LOGIN button"""
+        messagebox.showinfo("Discord Login", "Login functionality would connect to Discord API here.")
+        self.load_discord_page("https://discord.com/app")
 
-        self.content_text.insert(tk.END, "\n👥 Online Users:\n", "heading")
-        users = ["User1 (Online)", "User2 (Online)", "User3 (Away)", "User4 (Offline)"]
-        for user in users:
-            self.content_text.insert(tk.END, f"• {user}\n")
+    def scan_qr_code(self):
+        """Handle the QR code login button"""
+        messagebox.showinfo("QR Login", "QR code scanning would open camera here.")
 
-    def display_external_page(self):
-        """Display external page warning"""
-        self.content_text.insert(tk.END, "🔒 External Link\n", "title")
-        self.content_text.insert(tk.END, "=" * 20 + "\n\n")
-
-        self.content_text.insert(tk.END, f"URL: {self.current_url}\n\n")
-        self.content_text.insert(tk.END, "⚠️ This embedded browser is optimized for Discord.\n")
-        self.content_text.insert(tk.END, "For full web browsing, use your external browser.\n\n")
-
-        self.content_text.insert(tk.END, "[ Open in External Browser ]", "button")
-        self.content_text.insert(tk.END, " ")
-        self.content_text.insert(tk.END, "[ Back to Discord ]", "button")
-
-        self.content_text.tag_bind("button", "<Button-1>", self.handle_external_button_click)
-
-    def handle_link_click(self, event):
-        """Handle link clicking"""
-        # Get the clicked text
-        index = self.content_text.index(f"@{event.x},{event.y}")
-        line_start = self.content_text.index(f"{index} linestart")
-        line_end = self.content_text.index(f"{index} lineend")
-        line_text = self.content_text.get(line_start, line_end)
-
-        if "Download Discord" in line_text:
-            self.load_discord_page("https://discord.com/download")
-        elif "Open in Browser" in line_text:
-            webbrowser.open(self.current_url)
-        elif "Register here" in line_text:
-            self.load_discord_page("https://discord.com/register")
-        elif "Login here" in line_text:
-            self.load_discord_page("https://discord.com/login")
-        elif "Terms of Service" in line_text:
-            self.load_discord_page("https://discord.com/terms")
-        elif "Privacy Policy" in line_text:
-            self.load_discord_page("https://discord.com/privacy")
-        elif "Forgot Password?" in line_text:
-            self.load_discord_page("https://discord.com/forgot")
-
-    def handle_button_click(self, event):
-        """Handle button clicking"""
-        index = self.content_text.index(f"@{event.x},{event.y}")
-        line_start = self.content_text.index(f"{index} linestart")
-        line_end = self.content_text.index(f"{index} lineend")
-        clicked_text = self.content_text.get(line_start, line_end)
-
-        if "[ LOGIN ]" in clicked_text:
-            self.load_discord_page("https://discord.com/login")
-        elif "[ REGISTER ]" in clicked_text:
-            self.load_discord_page("https://discord.com/register")
-
-    def handle_login_button_click(self, event):
-        """Handle login-specific buttons"""
-        index = self.content_text.index(f"@{event.x},{event.y}")
-        line_start = self.content_text.index(f"{index} linestart")
-        line_end = self.content_text.index(f"{index} lineend")
-        clicked_text = self.content_text.get(line_start, line_end)
-
-        if "[ LOGIN ]" in clicked_text:
-            messagebox.showinfo("Discord Login", "Login functionality would connect to Discord API here.")
-            self.load_discord_page("https://discord.com/app")
-        elif "[📷 Scan QR Code]" in clicked_text:
-            messagebox.showinfo("QR Login", "QR code scanning would open camera here.")
-
-    def handle_register_button_click(self, event):
-        """Handle register-specific buttons"""
-        index = self.content_text.index(f"@{event.x},{event.y}")
-        line_start = self.content_text.index(f"{index} linestart")
-        line_end = self.content_text.index(f"{index} lineend")
-        clicked_text = self.content_text.get(line_start, line_end)
-
-        if "[ CONTINUE ]" in clicked_text:
-            messagebox.showinfo("Discord Registration", "Account creation would submit to Discord API here.")
-            self.load_discord_page("https://discord.com/login")
-
-    def handle_external_button_click(self, event):
-        """Handle external page buttons"""
-        index = self.content_text.index(f"@{event.x},{event.y}")
-        line_start = self.content_text.index(f"{index} linestart")
-        line_end = self.content_text.index(f"{index} lineend")
-        clicked_text = self.content_text.get(line_start, line_end)
-
-        if "[ Open in External Browser ]" in clicked_text:
-            webbrowser.open(self.current_url)
-        elif "[ Back to Discord ]" in clicked_text:
-            self.load_discord_page("https://discord.com")
+    def submit_registration(self):
+        """Handle the registration form's CONTINUE button"""
+        messagebox.showinfo("Discord Registration", "Account creation would submit to Discord API here.")
+        self.load_discord_page("https://discord.com/login")
 
     def navigate_to_url(self, event=None):
         """Navigate to URL in address bar"""
@@ -416,19 +572,21 @@ Discord is the easiest way to communicate over voice, video, and text. Chat, han
 
     def go_back(self):
         """Go back in history"""
-        if self.history_index > 0:
-            self.history_index -= 1
-            self.load_discord_page(self.history[self.history_index])
+        if self.back_stack:
+            self.forward_stack.append(self.current_url)
+            self.show_url(self.back_stack.pop())
 
     def go_forward(self):
         """Go forward in history"""
-        if self.history_index < len(self.history) - 1:
-            self.history_index += 1
-            self.load_discord_page(self.history[self.history_index])
+        if self.forward_stack:
+            self.back_stack.append(self.current_url)
+            self.show_url(self.forward_stack.pop())
 
     def refresh(self):
         """Refresh current page"""
-        self.display_discord_content()
+        if self.page_dirty:
+            self.page_cache.pop(self.current_url, None)
+            self.schedule_display()
         self.update_status("Page refreshed")
 
     def go_home(self):
@@ -438,13 +596,13 @@ Discord is the easiest way to communicate over voice, video, and text. Chat, han
     def update_nav_buttons(self):
         """Update navigation button states"""
         # Back button
-        if self.history_index > 0:
+        if self.back_stack:
             self.nav_buttons['back'].config(state=tk.NORMAL)
         else:
             self.nav_buttons['back'].config(state=tk.DISABLED)
 
         # Forward button
-        if self.history_index < len(self.history) - 1:
+        if self.forward_stack:
             self.nav_buttons['forward'].config(state=tk.NORMAL)
         else:
             self.nav_buttons['forward'].config(state=tk.DISABLED)
@@ -462,55 +620,159 @@ Discord is the easiest way to communicate over voice, video, and text. Chat, han
         self.browser_status_label.config(text="Ready - Discord Browser")
 
 class ModernChromeGUI:
-    def __init__(self):
+    # Left-panel sections in display order, mapped to their builder methods
+    SECTION_BUILDERS = {
+        'browser': 'create_browser_section',
+        'email': 'create_email_section',
+        'discord': 'create_discord_section',
+        'status': 'create_status_section',
+    }
+
+    # Section buttons as (label, method name), bound when the section is built
+    EMAIL_BUTTONS = (
+        ("Open Email Server", 'open_email_server'),
+        ("Create Account", 'create_email_account'),
+        ("View Inbox", 'view_email_inbox'),
+    )
+
+    DISCORD_BUTTONS = (
+        ("Go to Discord", 'open_discord_website'),
+        ("Account Creator", 'open_account_creator'),
+        ("Bulk Operations", 'open_bulk_operations'),
+    )
+
+    # Initial state of the System Status indicators
+    STATUS_ITEMS = (
+        ("Email Server", OFFLINE),
+        ("Embedded Browser", READY),
+        ("Discord Tools", READY),
+        ("External Browser", AVAILABLE),
+    )
+
+    # (name, description) rows of the bulk operations dialog
+    BULK_OPERATIONS = (
+        ("Create Multiple Accounts", "Create multiple Discord accounts automatically"),
+        ("Email Verification", "Verify email addresses for accounts"),
+        ("Server Joining", "Join Discord servers with created accounts"),
+        ("Profile Setup", "Configure account profiles and avatars"),
+        ("Token Management", "Manage account tokens and sessions"),
+    )
+
+    def __init__(self, shutdown_event=None):
+        # Set by a launcher (e.g. on Ctrl+C) to close the window from outside the Tk loop
+        self.shutdown_event = shutdown_event
         self.root = tk.Tk()
         self.root.title("RealLife AI Tools - Discord Account Manager")
         self.root.geometry("1920x1080")
-        self.root.configure(bg='#0a0a0a')
-
-        # Chrome-style color scheme
-        self.colors = {
-            'bg_dark': '#0a0a0a',
-            'bg_medium': '#1a1a1a',
-            'bg_light': '#2a2a2a',
-            'accent_blue': '#4285f4',
-            'accent_blue_dark': '#3367d6',
-            'text_white': '#ffffff',
-            'text_gray': '#cccccc',
-            'chrome_blue': '#1a73e8',
-            'chrome_blue_hover': '#1557b0'
-        }
+        self.root.configure(bg=PALETTE.bg_dark)
+
+        # Dict form of the palette, as EmbeddedDiscordBrowser expects
+        self.colors = vars(PALETTE)
 
-        self.setup_styles()
-        self.create_main_interface()
         self.embedded_browser = None
         self.brave_process = None
 
+        # Builders for panels that are constructed the first time they are shown
+        self.pending_panels = {}
+
+        # Left-panel section frames by name
+        self.sections = {}
+        self.status_indicators = {}
+
+        # Latest status bar message waiting for the next idle cycle
+        self.pending_status = None
+        self.status_scheduled = False
+
+        # Background work runs as coroutines on this loop, pumped from the Tk loop
+        self.loop = asyncio.new_event_loop()
+
+        self.setup_styles()
+        self.create_main_interface()
+
+        # Closing the window releases processes, connections and the event loop
+        self.root.protocol("WM_DELETE_WINDOW", self.cleanup)
+
     def setup_styles(self):
         """Setup modern chrome-style ttk styles"""
+        # Shared font objects; widgets reference these instead of font tuples
+        self.fonts = {
+            'title': font.Font(family='Segoe UI', size=24, weight='bold'),
+            'heading': font.Font(family='Segoe UI', size=16, weight='bold'),
+            'section': font.Font(family='Segoe UI', size=14, weight='bold'),
+            'item': font.Font(family='Segoe UI', size=12, weight='bold'),
+            'subtitle': font.Font(family='Segoe UI', size=12),
+            'body': font.Font(family='Segoe UI', size=10),
+            'body_bold': font.Font(family='Segoe UI', size=10, weight='bold'),
+            'small': font.Font(family='Segoe UI', size=9),
+            'small_bold': font.Font(family='Segoe UI', size=9, weight='bold'),
+            'content': font.Font(family='Consolas', size=10)
+        }
+
+        # Measure the symbol glyphs once in the fonts that draw them, so Tk
+        # resolves their fallback fonts here rather than on each widget's first draw
+        for name in ('item', 'subtitle', 'body'):
+            self.fonts[name].measure(ICON_GLYPHS)
+
+        # Widget defaults for the whole window; constructors only pass overrides
+        self.root.option_add('*Font', self.fonts['body'])
+        self.root.option_add('*Background', PALETTE.bg_dark)
+        self.root.option_add('*Foreground', PALETTE.text_white)
+        self.root.option_add('*Button.borderWidth', 0)
+
         style = ttk.Style()
 
+        # Native Windows themes ignore ttk button colors; clam honors them
+        style.theme_use('clam')
+
         # Configure overall theme
-        style.configure('TFrame', background=self.colors['bg_dark'])
-        style.configure('TLabel', background=self.colors['bg_dark'], foreground=self.colors['text_white'])
-        style.configure('TButton', font=('Segoe UI', 10, 'bold'))
+        style.configure('TFrame', background=PALETTE.bg_dark)
+        style.configure('TLabel', background=PALETTE.bg_dark, foreground=PALETTE.text_white)
+        style.configure('TButton', font=self.fonts['body_bold'])
 
         # Chrome-style button
         style.configure('Chrome.TButton',
-                       background=self.colors['chrome_blue'],
-                       foreground=self.colors['text_white'],
+                       font=self.fonts['body'],
+                       background=PALETTE.chrome_blue,
+                       foreground=PALETTE.text_white,
                        borderwidth=0,
                        focusthickness=0,
                        relief='flat',
                        padding=(20, 10))
 
         style.map('Chrome.TButton',
-                 background=[('active', self.colors['chrome_blue_hover']),
-                           ('pressed', self.colors['accent_blue_dark'])])
+                 background=[('active', PALETTE.chrome_blue_hover),
+                           ('pressed', PALETTE.accent_blue_dark)])
+
+        # Section button on the lighter panels
+        style.configure('Dark.TButton',
+                       font=self.fonts['body'],
+                       background=PALETTE.bg_dark,
+                       foreground=PALETTE.text_white,
+                       borderwidth=0,
+                       focusthickness=0,
+                       relief='flat',
+                       padding=(20, 8))
+
+        style.map('Dark.TButton',
+                 background=[('active', PALETTE.bg_light),
+                           ('pressed', PALETTE.bg_medium)])
+
+        # Borderless glyph button for the window controls
+        style.configure('Nav.TButton',
+                       font=self.fonts['item'],
+                       background=PALETTE.bg_dark,
+                       foreground=PALETTE.text_white,
+                       borderwidth=0,
+                       focusthickness=0,
+                       relief='flat',
+                       padding=(6, 2))
+
+        style.map('Nav.TButton',
+                 background=[('active', PALETTE.bg_light)])
 
         # Modern card style
         style.configure('Card.TFrame',
-                       background=self.colors['bg_medium'],
+                       background=PALETTE.bg_medium,
                        borderwidth=1,
                        relief='solid')
 
@@ -528,181 +790,161 @@ class ModernChromeGUI:
         content_frame.pack(fill=tk.BOTH, expand=True, pady=(30, 0))
 
         # Left panel - Tools and controls
-        left_panel = self.create_left_panel(content_frame)
+        self.create_left_panel(content_frame)
 
         # Right panel - Browser integration
-        right_panel = self.create_right_panel(content_frame)
+        self.create_right_panel(content_frame)
 
         # Status bar
         self.create_status_bar(main_frame)
 
     def create_header(self, parent):
         """Create chrome-style header"""
-        header_frame = tk.Frame(parent, bg=self.colors['bg_dark'], height=80)
+        # Gridded with a minimum row height instead of a fixed, non-propagating frame
+        header_frame = tk.Frame(parent)
         header_frame.pack(fill=tk.X, pady=(0, 20))
-        header_frame.pack_propagate(False)
+        header_frame.rowconfigure(0, minsize=80)
+        header_frame.columnconfigure(0, weight=1)
 
         # Logo/title area
-        title_frame = tk.Frame(header_frame, bg=self.colors['bg_dark'])
-        title_frame.pack(side=tk.LEFT, padx=20)
+        title_frame = tk.Frame(header_frame)
+        title_frame.grid(row=0, column=0, sticky='w', padx=20)
 
         title_label = tk.Label(title_frame,
                               text="RealLife AI Tools",
-                              font=('Segoe UI', 24, 'bold'),
-                              fg=self.colors['accent_blue'],
-                              bg=self.colors['bg_dark'])
+                              font=self.fonts['title'],
+                              fg=PALETTE.accent_blue)
         title_label.pack(anchor=tk.W)
 
         subtitle_label = tk.Label(title_frame,
                                  text="Discord Account Management Suite",
-                                 font=('Segoe UI', 12),
-                                 fg=self.colors['text_gray'],
-                                 bg=self.colors['bg_dark'])
+                                 font=self.fonts['subtitle'],
+                                 fg=PALETTE.text_gray)
         subtitle_label.pack(anchor=tk.W)
 
         # Control buttons
-        control_frame = tk.Frame(header_frame, bg=self.colors['bg_dark'])
-        control_frame.pack(side=tk.RIGHT, padx=20)
+        control_frame = tk.Frame(header_frame)
+        control_frame.grid(row=0, column=1, sticky='e', padx=20)
 
         # Minimize button
-        min_btn = tk.Button(control_frame, text="─", font=('Segoe UI', 12, 'bold'),
-                           bg=self.colors['bg_dark'], fg=self.colors['text_white'],
-                           borderwidth=0, command=self.minimize_window)
+        min_btn = ttk.Button(control_frame, text="─", style='Nav.TButton',
+                            command=self.minimize_window)
         min_btn.pack(side=tk.LEFT, padx=(0, 10))
 
         # Close button
-        close_btn = tk.Button(control_frame, text="✕", font=('Segoe UI', 12, 'bold'),
-                             bg=self.colors['bg_dark'], fg=self.colors['text_white'],
-                             borderwidth=0, command=self.root.quit)
+        close_btn = ttk.Button(control_frame, text="✕", style='Nav.TButton',
+                              command=self.root.quit)
         close_btn.pack(side=tk.LEFT)
 
     def create_left_panel(self, parent):
         """Create left control panel"""
-        left_frame = tk.Frame(parent, bg=self.colors['bg_medium'], width=400)
+        left_frame = tk.Frame(parent, bg=PALETTE.bg_medium, width=400)
         left_frame.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 20))
         left_frame.pack_propagate(False)
+        self.left_panel = left_frame
 
         # Tools section
         tools_label = tk.Label(left_frame, text="TOOLS & CONTROLS",
-                              font=('Segoe UI', 14, 'bold'),
-                              fg=self.colors['accent_blue'],
-                              bg=self.colors['bg_medium'])
+                              font=self.fonts['section'],
+                              fg=PALETTE.accent_blue,
+                              bg=PALETTE.bg_medium)
         tools_label.pack(pady=(20, 10), anchor=tk.W, padx=20)
 
-        # Brave Browser section
-        browser_frame = tk.Frame(left_frame, bg=self.colors['bg_light'])
-        browser_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
-
-        browser_title = tk.Label(browser_frame, text="🌐 Brave Browser",
-                                font=('Segoe UI', 12, 'bold'),
-                                fg=self.colors['text_white'],
-                                bg=self.colors['bg_light'])
-        browser_title.pack(pady=(10, 5), anchor=tk.W, padx=10)
-
-        launch_brave_btn = tk.Button(browser_frame, text="Launch Brave Browser",
-                                    font=('Segoe UI', 10),
-                                    bg=self.colors['chrome_blue'],
-                                    fg=self.colors['text_white'],
-                                    borderwidth=0,
-                                    padx=20, pady=10,
-                                    command=self.launch_brave_browser)
+        for name in self.SECTION_BUILDERS:
+            self.build_section(name)
+
+    def build_section(self, name):
+        """Build a left-panel section once and reuse its frame afterwards"""
+        section = self.sections.get(name)
+        if section is None:
+            builder = getattr(self, self.SECTION_BUILDERS[name])
+            section = self.sections[name] = builder(self.left_panel)
+        return section
+
+    def create_browser_section(self, parent):
+        """Create the Brave Browser section"""
+        browser_frame = self.create_section(parent, "🌐 Brave Browser")
+
+        launch_brave_btn = ttk.Button(browser_frame, text="Launch Brave Browser",
+                                     style='Chrome.TButton',
+                                     command=self.launch_brave_browser)
         launch_brave_btn.pack(pady=(0, 10), padx=10, fill=tk.X)
+        return browser_frame
 
-        # Email System section
-        email_frame = tk.Frame(left_frame, bg=self.colors['bg_light'])
-        email_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
+    def create_email_section(self, parent):
+        """Create the Email System section"""
+        email_frame = self.create_section(parent, "📧 Email System")
 
-        email_title = tk.Label(email_frame, text="📧 Email System",
-                              font=('Segoe UI', 12, 'bold'),
-                              fg=self.colors['text_white'],
-                              bg=self.colors['bg_light'])
-        email_title.pack(pady=(10, 5), anchor=tk.W, padx=10)
-
-        email_buttons = [
-            ("Open Email Server", self.open_email_server),
-            ("Create Account", self.create_email_account),
-            ("View Inbox", self.view_email_inbox)
-        ]
-
-        for btn_text, cmd in email_buttons:
-            btn = tk.Button(email_frame, text=btn_text,
-                           font=('Segoe UI', 10),
-                           bg=self.colors['bg_dark'],
-                           fg=self.colors['text_white'],
-                           borderwidth=0,
-                           padx=20, pady=8,
-                           command=cmd)
-            btn.pack(pady=(0, 5), padx=10, fill=tk.X)
-
-        # Discord Tools section
-        discord_frame = tk.Frame(left_frame, bg=self.colors['bg_light'])
-        discord_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
-
-        discord_title = tk.Label(discord_frame, text="🎮 Discord Tools",
-                                font=('Segoe UI', 12, 'bold'),
-                                fg=self.colors['text_white'],
-                                bg=self.colors['bg_light'])
-        discord_title.pack(pady=(10, 5), anchor=tk.W, padx=10)
-
-        discord_buttons = [
-            ("Go to Discord", self.open_discord_website),
-            ("Account Creator", self.open_account_creator),
-            ("Bulk Operations", self.open_bulk_operations)
-        ]
-
-        for btn_text, cmd in discord_buttons:
-            btn = tk.Button(discord_frame, text=btn_text,
-                           font=('Segoe UI', 10),
-                           bg=self.colors['bg_dark'],
-                           fg=self.colors['text_white'],
-                           borderwidth=0,
-                           padx=20, pady=8,
-                           command=cmd)
-            btn.pack(pady=(0, 5), padx=10, fill=tk.X)
-
-        # System Status section
-        status_frame = tk.Frame(left_frame, bg=self.colors['bg_light'])
-        status_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
-
-        status_title = tk.Label(status_frame, text="📊 System Status",
-                               font=('Segoe UI', 12, 'bold'),
-                               fg=self.colors['text_white'],
-                               bg=self.colors['bg_light'])
-        status_title.pack(pady=(10, 5), anchor=tk.W, padx=10)
+        add_buttons(email_frame, ((text, getattr(self, name)) for text, name in self.EMAIL_BUTTONS),
+                    {'pady': (0, 5), 'padx': 10, 'fill': tk.X},
+                    button_class=ttk.Button, style='Dark.TButton')
+        return email_frame
+
+    def create_discord_section(self, parent):
+        """Create the Discord Tools section"""
+        discord_frame = self.create_section(parent, "🎮 Discord Tools")
+
+        add_buttons(discord_frame, ((text, getattr(self, name)) for text, name in self.DISCORD_BUTTONS),
+                    {'pady': (0, 5), 'padx': 10, 'fill': tk.X},
+                    button_class=ttk.Button, style='Dark.TButton')
+        return discord_frame
+
+    def create_status_section(self, parent):
+        """Create the System Status section"""
+        status_frame = self.create_section(parent, "📊 System Status")
 
         # Status indicators
         self.status_indicators = {}
-        status_items = [
-            ("Email Server", "offline"),
-            ("Embedded Browser", "ready"),
-            ("Discord Tools", "ready"),
-            ("External Browser", "available")
-        ]
-
-        for item, status in status_items:
-            indicator_frame = tk.Frame(status_frame, bg=self.colors['bg_light'])
+        for item, status in self.STATUS_ITEMS:
+            indicator_frame = tk.Frame(status_frame, bg=PALETTE.bg_light)
             indicator_frame.pack(fill=tk.X, padx=10, pady=2)
 
             label = tk.Label(indicator_frame, text=f"{item}:",
-                            font=('Segoe UI', 9),
-                            fg=self.colors['text_gray'],
-                            bg=self.colors['bg_light'])
+                            font=self.fonts['small'],
+                            fg=PALETTE.text_gray,
+                            bg=PALETTE.bg_light)
             label.pack(side=tk.LEFT)
 
             status_label = tk.Label(indicator_frame, text=status.upper(),
-                                   font=('Segoe UI', 9, 'bold'),
+                                   font=self.fonts['small_bold'],
                                    fg=self.get_status_color(status),
-                                   bg=self.colors['bg_light'])
+                                   bg=PALETTE.bg_light)
             status_label.pack(side=tk.RIGHT)
             self.status_indicators[item] = status_label
+        return status_frame
+
+    def create_section(self, parent, title):
+        """Create a titled left-panel section; the frame draws its own caption"""
+        section = tk.LabelFrame(parent, text=title,
+                                font=self.fonts['item'],
+                                bg=PALETTE.bg_light,
+                                bd=0, labelanchor='nw', pady=5)
+        section.pack(fill=tk.X, padx=20, pady=(0, 20))
+        return section
 
     def create_right_panel(self, parent):
         """Create right panel for embedded Discord browser"""
-        right_frame = tk.Frame(parent, bg=self.colors['bg_medium'])
+        right_frame = tk.Frame(parent, bg=PALETTE.bg_medium)
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
 
+        # Shown until the browser is built
+        self.browser_placeholder = tk.Label(right_frame, text="Loading Discord…",
+                                            font=self.fonts['subtitle'],
+                                            fg=PALETTE.text_gray,
+                                            bg=PALETTE.bg_medium)
+        self.browser_placeholder.pack(expand=True)
+
+        # The embedded browser is the heaviest part of the window, so build it
+        # once its frame has been mapped and the placeholder drawn
+        self.pending_panels['browser'] = lambda: self.create_embedded_browser(right_frame)
+        right_frame.bind('<Map>', lambda event: self.root.after_idle(self.build_pending_panel, 'browser'))
+
+    def create_embedded_browser(self, right_frame):
+        """Create the embedded Discord browser inside the right panel"""
+        self.browser_placeholder.destroy()
+
         # Create embedded browser
-        self.embedded_browser = EmbeddedDiscordBrowser(right_frame, self.colors)
+        self.embedded_browser = EmbeddedDiscordBrowser(right_frame, self.colors, self.loop, self.fonts)
         self.embedded_browser.browser_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Update URL entry reference for compatibility
@@ -710,47 +952,54 @@ class ModernChromeGUI:
 
         # Update status indicators
         if self.status_indicators.get("Embedded Browser"):
-            self.status_indicators["Embedded Browser"].config(text="ACTIVE", fg=self.get_status_color("online"))
+            self.status_indicators["Embedded Browser"].config(text="ACTIVE", fg=self.get_status_color(ONLINE))
         if self.status_indicators.get("Discord Tools"):
-            self.status_indicators["Discord Tools"].config(text="READY", fg=self.get_status_color("ready"))
+            self.status_indicators["Discord Tools"].config(text="READY", fg=self.get_status_color(READY))
 
     def create_status_bar(self, parent):
         """Create bottom status bar"""
-        status_frame = tk.Frame(parent, bg=self.colors['bg_dark'], height=30)
+        # Gridded so the bar takes its height from the labels
+        status_frame = tk.Frame(parent)
         status_frame.pack(fill=tk.X, pady=(20, 0))
-        status_frame.pack_propagate(False)
+        status_frame.columnconfigure(0, weight=1)
 
         # Status messages
         self.status_label = tk.Label(status_frame,
                                     text="Ready - RealLife AI Tools v1.0",
-                                    font=('Segoe UI', 9),
-                                    fg=self.colors['text_gray'],
-                                    bg=self.colors['bg_dark'])
-        self.status_label.pack(side=tk.LEFT, padx=20)
+                                    font=self.fonts['small'],
+                                    fg=PALETTE.text_gray)
+        self.status_label.grid(row=0, column=0, sticky='w', padx=20, pady=6)
 
         # Version info
         version_label = tk.Label(status_frame,
                                 text="v1.0.0",
-                                font=('Segoe UI', 9),
-                                fg=self.colors['text_gray'],
-                                bg=self.colors['bg_dark'])
-        version_label.pack(side=tk.RIGHT, padx=20)
+                                font=self.fonts['small'],
+                                fg=PALETTE.text_gray)
+        version_label.grid(row=0, column=1, sticky='e', padx=20, pady=6)
+
+    def build_pending_panel(self, name):
+        """Build a deferred panel the first time it is needed"""
+        builder = self.pending_panels.pop(name, None)
+        if builder:
+            builder()
 
     # Utility methods
     def get_status_color(self, status):
         """Get color for status indicator"""
-        colors = {
-            'online': '#4CAF50',
-            'ready': '#2196F3',
-            'connected': '#4CAF50',
-            'offline': '#f44336',
-            'error': '#f44336'
-        }
-        return colors.get(status.lower(), self.colors['text_gray'])
+        return status_color(status, PALETTE.text_gray)
 
     def update_status(self, message):
         """Update status bar message"""
-        self.status_label.config(text=message)
+        # Only the latest message per idle cycle reaches the label
+        self.pending_status = message
+        if not self.status_scheduled:
+            self.status_scheduled = True
+            self.root.after_idle(self.flush_status)
+
+    def flush_status(self):
+        """Apply the most recent status bar message"""
+        self.status_scheduled = False
+        self.status_label.config(text=self.pending_status)
 
     # Button command methods
     def minimize_window(self):
@@ -759,36 +1008,55 @@ class ModernChromeGUI:
 
     def launch_brave_browser(self):
         """Launch Brave browser externally"""
+        brave_path = find_brave_path()
+        if not brave_path:
+            messagebox.showerror("Error", "Brave browser not found at expected location")
+            return
+
+        self.update_status("Launching Brave Browser...")
+        self.schedule(self.launch_brave(brave_path))
+
+    async def launch_brave(self, brave_path):
+        """Start Brave without blocking the window"""
+        import subprocess
+
         try:
-            brave_path = r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe"
-            if os.path.exists(brave_path):
-                self.brave_process = subprocess.Popen([brave_path])
-                self.update_status("Brave Browser launched externally")
-                if self.status_indicators.get("External Browser"):
-                    self.status_indicators["External Browser"].config(text="RUNNING", fg=self.get_status_color("online"))
-                messagebox.showinfo("External Browser", "Brave browser opened in new window.\nUse the embedded browser for Discord operations.")
-            else:
-                messagebox.showerror("Error", "Brave browser not found at expected location")
+            # Process creation can take a noticeable moment; run it on the loop's executor
+            self.brave_process = await self.loop.run_in_executor(None, partial(
+                subprocess.Popen, [brave_path], creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+            ))
         except Exception as e:
             messagebox.showerror("Error", f"Failed to launch Brave: {str(e)}")
+            return
+
+        self.update_status("Brave Browser launched externally")
+        if self.status_indicators.get("External Browser"):
+            self.status_indicators["External Browser"].config(text="RUNNING", fg=self.get_status_color(ONLINE))
+        messagebox.showinfo("External Browser", "Brave browser opened in new window.\nUse the embedded browser for Discord operations.")
 
     def open_email_server(self):
         """Open email server interface"""
+        self.schedule(self.load_email_server())
+
+    async def load_email_server(self):
+        """Check the email server without blocking the window, then open it"""
         try:
             # Check if email server is running
-            import requests
-            response = requests.get("http://localhost:5000", timeout=2)
+            response = await self.loop.run_in_executor(None, probe_health)
             if response.status_code == 200:
                 # Open in embedded browser
                 if self.embedded_browser:
                     self.embedded_browser.load_discord_page("http://localhost:5000")
                     self.update_status("Email server loaded in embedded browser")
                 else:
-                    webbrowser.open("http://localhost:5000")
-                    self.update_status("Email server opened externally")
+                    await self.open_external_url("http://localhost:5000", "Email server opened externally")
             else:
                 raise Exception("Server not responding")
         except Exception as e:
+            from requests.exceptions import ReadTimeout
+            if isinstance(e, ReadTimeout):
+                messagebox.showerror("Email Server", f"Email server is running but did not answer in time.\n\nError: {str(e)}")
+                return
             messagebox.showerror("Email Server", f"Email server not running.\nPlease start the email server first.\n\nError: {str(e)}")
 
     def create_email_account(self):
@@ -797,11 +1065,7 @@ class ModernChromeGUI:
             self.embedded_browser.load_discord_page("http://localhost:5000/register")
             self.update_status("Email registration page loaded")
         else:
-            try:
-                webbrowser.open("http://localhost:5000/register")
-                self.update_status("Email registration opened externally")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to open email registration: {str(e)}")
+            self.schedule(self.open_external_url("http://localhost:5000/register", "Email registration opened externally"))
 
     def view_email_inbox(self):
         """View email inbox"""
@@ -809,11 +1073,7 @@ class ModernChromeGUI:
             self.embedded_browser.load_discord_page("http://localhost:5000/dashboard")
             self.update_status("Email dashboard loaded")
         else:
-            try:
-                webbrowser.open("http://localhost:5000/dashboard")
-                self.update_status("Email dashboard opened externally")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to open email dashboard: {str(e)}")
+            self.schedule(self.open_external_url("http://localhost:5000/dashboard", "Email dashboard opened externally"))
 
     def open_discord_website(self):
         """Open Discord website in embedded browser"""
@@ -821,11 +1081,7 @@ class ModernChromeGUI:
             self.embedded_browser.load_discord_page("https://discord.com")
             self.update_status("Discord website loaded in embedded browser")
         else:
-            try:
-                webbrowser.open("https://discord.com")
-                self.update_status("Discord website opened externally")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to open Discord: {str(e)}")
+            self.schedule(self.open_external_url("https://discord.com", "Discord website opened externally"))
 
     def open_account_creator(self):
         """Open Discord account creator in embedded browser"""
@@ -838,62 +1094,46 @@ class ModernChromeGUI:
     def open_bulk_operations(self):
         """Open bulk operations interface"""
         bulk_window = tk.Toplevel(self.root)
+        # Keep the dialog unmapped while it is populated so it paints once, fully laid out
+        bulk_window.withdraw()
         bulk_window.title("Discord Bulk Operations")
         bulk_window.geometry("600x400")
-        bulk_window.configure(bg=self.colors['bg_dark'])
+        bulk_window.configure(bg=PALETTE.bg_dark)
 
         title_label = tk.Label(bulk_window, text="Discord Bulk Account Operations",
-                              font=('Segoe UI', 16, 'bold'),
-                              fg=self.colors['chrome_blue'],
-                              bg=self.colors['bg_dark'])
+                              font=self.fonts['heading'],
+                              fg=PALETTE.chrome_blue)
         title_label.pack(pady=20)
 
         # Bulk operations content
-        content_frame = tk.Frame(bulk_window, bg=self.colors['bg_medium'])
+        content_frame = tk.Frame(bulk_window, bg=PALETTE.bg_medium)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
 
-        operations = [
-            ("Create Multiple Accounts", "Create multiple Discord accounts automatically"),
-            ("Email Verification", "Verify email addresses for accounts"),
-            ("Server Joining", "Join Discord servers with created accounts"),
-            ("Profile Setup", "Configure account profiles and avatars"),
-            ("Token Management", "Manage account tokens and sessions")
-        ]
+        # Shared widget options, built once for every row
+        frame_style = dict(bg=PALETTE.bg_light, pady=10, padx=15)
+        name_style = dict(font=self.fonts['item'], bg=PALETTE.bg_light)
+        desc_style = dict(fg=PALETTE.text_gray, bg=PALETTE.bg_light)
 
-        for op_name, op_desc in operations:
-            op_frame = tk.Frame(content_frame, bg=self.colors['bg_light'], pady=10, padx=15)
+        for op_name, op_desc in self.BULK_OPERATIONS:
+            op_frame = tk.Frame(content_frame, **frame_style)
             op_frame.pack(fill=tk.X, pady=5)
 
-            name_label = tk.Label(op_frame, text=op_name,
-                                 font=('Segoe UI', 12, 'bold'),
-                                 fg=self.colors['text_white'],
-                                 bg=self.colors['bg_light'])
-            name_label.pack(anchor=tk.W)
-
-            desc_label = tk.Label(op_frame, text=op_desc,
-                                 font=('Segoe UI', 10),
-                                 fg=self.colors['text_gray'],
-                                 bg=self.colors['bg_light'])
-            desc_label.pack(anchor=tk.W)
-
-            btn = tk.Button(op_frame, text="Execute",
-                           font=('Segoe UI', 10),
-                           bg=self.colors['chrome_blue'],
-                           fg=self.colors['text_white'],
-                           borderwidth=0,
-                           padx=15, pady=5,
-                           command=lambda n=op_name: self.execute_bulk_operation(n))
+            tk.Label(op_frame, text=op_name, **name_style).pack(anchor=tk.W)
+            tk.Label(op_frame, text=op_desc, **desc_style).pack(anchor=tk.W)
+
+            btn = ttk.Button(op_frame, text="Execute",
+                            style='Chrome.TButton',
+                            command=partial(self.execute_bulk_operation, op_name))
             btn.pack(anchor=tk.E)
 
-        close_btn = tk.Button(bulk_window, text="Close",
-                             font=('Segoe UI', 10),
-                             bg=self.colors['bg_dark'],
-                             fg=self.colors['text_white'],
-                             borderwidth=0,
-                             padx=20, pady=8,
-                             command=bulk_window.destroy)
+        close_btn = ttk.Button(bulk_window, text="Close",
+                              style='Dark.TButton',
+                              command=bulk_window.destroy)
         close_btn.pack(pady=(0, 20))
 
+        bulk_window.update_idletasks()
+        bulk_window.deiconify()
+
         self.update_status("Bulk operations interface opened")
 
     def browser_back(self):
@@ -927,11 +1167,16 @@ class ModernChromeGUI:
         else:
             url = self.url_entry.get()
             if url:
-                try:
-                    webbrowser.open(url)
-                    self.update_status(f"Opened: {url}")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to navigate: {str(e)}")
+                self.schedule(self.open_external_url(url))
+
+    async def open_external_url(self, url, status=None):
+        """Open a URL in the system browser without blocking the window"""
+        try:
+            if not await self.loop.run_in_executor(None, open_url, url):
+                raise RuntimeError("no external browser available")
+            self.update_status(status or f"Opened: {url}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open {url}: {str(e)}")
 
     def execute_bulk_operation(self, operation_name):
         """Execute bulk operation"""
@@ -948,9 +1193,34 @@ class ModernChromeGUI:
 
         self.update_status(f"Bulk operation attempted: {operation_name}")
 
+    def schedule(self, coro):
+        """Run a coroutine on the GUI's event loop"""
+        return self.loop.create_task(coro)
+
+    def pump_event_loop(self):
+        """Run the asyncio callbacks that are due, then reschedule on the Tk loop"""
+        # A modal dialog opened from a coroutine runs a nested Tk loop that can
+        # land here while the asyncio loop is still running
+        if not self.loop.is_running():
+            self.loop.call_soon(self.loop.stop)
+            self.loop.run_forever()
+        self.root.after(self.next_pump_delay(), self.pump_event_loop)
+
+    def next_pump_delay(self):
+        """Milliseconds until the asyncio loop next has work, capped at 50"""
+        if getattr(self.loop, '_ready', None):
+            return 0
+        scheduled = getattr(self.loop, '_scheduled', None)
+        if scheduled:
+            return min(50, max(0, int((scheduled[0].when() - self.loop.time()) * 1000)))
+        return 50
+
     def run(self):
         """Start the GUI application"""
         try:
+            self.root.after(0, self.pump_event_loop)
+            if self.shutdown_event is not None:
+                self.root.after(100, self.watch_shutdown)
             self.root.mainloop()
         except KeyboardInterrupt:
             self.cleanup()
@@ -958,6 +1228,13 @@ class ModernChromeGUI:
             print(f"GUI Error: {e}")
             self.cleanup()
 
+    def watch_shutdown(self):
+        """Close the window once the launcher signals shutdown"""
+        if self.shutdown_event.is_set():
+            self.cleanup()
+        else:
+            self.root.after(100, self.watch_shutdown)
+
     def cleanup(self):
         """Clean up resources before exit"""
         try:
@@ -969,6 +1246,22 @@ class ModernChromeGUI:
                 except:
                     self.brave_process.kill()
 
+            # Close the embedded browser's pooled connections
+            if self.embedded_browser:
+                self.embedded_browser.close()
+
+            # Stop any background work still pending
+            if hasattr(self, 'loop') and not self.loop.is_closed():
+                tasks = asyncio.all_tasks(self.loop)
+                for task in tasks:
+                    task.cancel()
+                if not self.loop.is_running():
+                    if tasks:
+                        self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+                    # Wait for fetches and launches still running on the default executor
+                    self.loop.run_until_complete(self.loop.shutdown_default_executor())
+                self.loop.close()
+
             # Destroy main window
             if hasattr(self, 'root') and self.root:
                 self.root.destroy()
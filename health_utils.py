@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Health check helpers for RealLife AI Tools
+Shared by the GUI and the unified launcher
+"""
+
+from functools import lru_cache
+
+HEALTH_URL = "http://localhost:5000/health"
+
+# (connect, read) seconds: a refused local port fails fast, a busy server gets a little longer
+HEALTH_TIMEOUT = (0.5, 1.5)
+
+@lru_cache(maxsize=1)
+def health_session():
+    """Return the keep-alive session shared by health probes, importing requests on first use"""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount('http://', HTTPAdapter(pool_connections=2, pool_maxsize=2))
+    return session
+
+def probe_health(url=HEALTH_URL, timeout=HEALTH_TIMEOUT):
+    """Probe a health endpoint with HEAD, falling back to GET if HEAD is not allowed"""
+    session = health_session()
+    response = session.head(url, timeout=timeout)
+    if response.status_code == 405:
+        response = session.get(url, timeout=timeout)
+    return response
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Import helpers for RealLife AI Tools
+Shared by the build and system-check scripts
+"""
+
+import sys
+from importlib import import_module
+
+def cached_import(module_name, item_name):
+    """Return an attribute from a module, importing it only if not loaded yet"""
+    modules = sys.modules
+    if module_name not in modules:
+        import_module(module_name)
+    return getattr(modules[module_name], item_name)
@@ -6,27 +6,64 @@ Runs both the GUI interface and email server
 
 import os
 import sys
-import subprocess
+import importlib.util
 import threading
 import time
-import webbrowser
+import urllib.request
 from pathlib import Path
 
+RULE = "=" * 60
+BANNER = f"""{RULE}
+     RealLife AI Tools - Discord Account Manager
+{RULE}
+Features:
+• Modern Chrome-style GUI (1920x1080)
+• Integrated Brave Browser
+• Email server with user management
+• Professional email interface
+{RULE}
+"""
+READY_BANNER = f"""
+{RULE}
+Ready! Starting GUI...
+The email server is running at: http://localhost:5000
+{RULE}
+"""
+
+# tkinter is checked through its _tkinter C extension: the pure-Python package
+# is found even when Tk itself is missing or broken
+REQUIRED_MODULES = ["flask", "flask_sqlalchemy", "flask_bcrypt", "flask_mail", "PIL", "_tkinter"]
+
 def check_requirements():
     """Check if required packages are installed"""
-    try:
-        import flask
-        import flask_sqlalchemy
-        import flask_bcrypt
-        import flask_mail
-        import PIL
-        import tkinter
+    # find_spec locates a package without executing it; the real imports happen on first use
+    missing = [name for name in REQUIRED_MODULES if importlib.util.find_spec(name) is None]
+
+    if not missing:
         print("[OK] All required packages are installed")
         return True
-    except ImportError as e:
-        print(f"[ERROR] Missing required package: {e}")
-        print("Run: pip install -r requirements.txt")
-        return False
+
+    for name in missing:
+        print(f"[ERROR] Missing required package: {name}")
+    print("Run: pip install -r requirements.txt")
+    return False
+
+def wait_for_server(url, deadline=10.0, step=0.1):
+    """Poll url with a growing interval until it answers 200 or the deadline expires"""
+    start = time.monotonic()
+    while time.monotonic() - start < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    print()
+                    return True
+        except OSError:
+            pass
+        print(".", end="", flush=True)
+        time.sleep(step)
+        step = min(step * 1.5, 1.0)
+    print()
+    return False
 
 def start_email_server():
     """Start the email server in a separate thread"""
@@ -42,11 +79,13 @@ def start_email_server():
         server_thread = threading.Thread(target=run_server, daemon=True)
         server_thread.start()
 
-        # Wait a moment for server to start
-        time.sleep(2)
+        # Wait until the server answers rather than for a fixed time
+        if not wait_for_server("http://localhost:5000/health"):
+            print("[WARN] Email server is not answering yet - continuing anyway")
         print("[OK] Email server started on http://localhost:5000")
 
         # Open browser to email server
+        import webbrowser
         webbrowser.open("http://localhost:5000")
 
         return True
@@ -67,15 +106,8 @@ def start_gui():
 
 def main():
     """Main launcher function"""
-    print("=" * 60)
-    print("     RealLife AI Tools - Discord Account Manager")
-    print("=" * 60)
-    print("Features:")
-    print("• Modern Chrome-style GUI (1920x1080)")
-    print("• Integrated Brave Browser")
-    print("• Email server with user management")
-    print("• Professional email interface")
-    print("=" * 60)
+    sys.stdout.write(BANNER)
+    sys.stdout.flush()
 
     # Check if we're in the right directory
     if not Path("gui_main.py").exists() or not Path("email_server.py").exists():
@@ -88,12 +120,8 @@ def main():
 
     # Start email server first
     if start_email_server():
-        print("\n" + "=" * 60)
-        print("Ready! Starting GUI in 3 seconds...")
-        print("The email server is running at: http://localhost:5000")
-        print("=" * 60)
-
-        time.sleep(3)
+        sys.stdout.write(READY_BANNER)
+        sys.stdout.flush()
 
         # Start GUI (this will block until GUI is closed)
         start_gui()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+RealLife AI Tools - Complete System Launcher
+Launches both GUI and web server simultaneously
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+def run_email_server():
+    """Run the email server in this process"""
+    from email_server import app
+    print('Email server running on http://localhost:5000')
+    app.run(host='0.0.0.0', port=5000, debug=False, use_reloader=False)
+
+def main():
+    print("=" * 60)
+    print("     RealLife AI Tools - Complete System")
+    print("=" * 60)
+    print("🚀 Launching GUI + Web Server + AI Host")
+    print("=" * 60)
+
+    project_root = Path(__file__).parent
+    sys.path.insert(0, str(project_root))
+
+    # Start email server in background
+    print("📧 Starting Email Server...")
+    server_thread = threading.Thread(target=run_email_server, daemon=True)
+    server_thread.start()
+
+    # Wait until the server accepts connections, up to a bounded deadline
+    from check_system import check_port_open
+    deadline = time.monotonic() + 5.0
+    while time.monotonic() < deadline:
+        if check_port_open('localhost', 5000):
+            break
+        time.sleep(0.05)
+    else:
+        print("⚠️ Email server not responding yet - continuing anyway")
+
+    # Launch GUI
+    print("🖥️  Launching GUI Application...")
+    try:
+        from gui_main import ModernChromeGUI
+        gui = ModernChromeGUI()
+        gui.run()
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down gracefully...")
+    except Exception as e:
+        print(f"❌ GUI Error: {e}")
+        print("💡 The web server may still be running on http://localhost:5000")
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ Test script for GUI functionality without launching the full interface
 
 import sys
 import os
+from collections import deque
 
 def test_imports():
     """Test all GUI imports"""
@@ -43,8 +44,8 @@ def test_browser_class():
         browser.parent = parent
         browser.colors = colors
         browser.current_url = "https://discord.com"
-        browser.history = []
-        browser.history_index = -1
+        browser.back_stack = deque(maxlen=EmbeddedDiscordBrowser.HISTORY_LIMIT)
+        browser.forward_stack = deque(maxlen=EmbeddedDiscordBrowser.HISTORY_LIMIT)
 
         print("[OK] Embedded browser class initialization successful")
         return True
@@ -57,10 +58,7 @@ def test_button_methods():
     try:
         from gui_main import ModernChromeGUI
 
-        # Create instance without __init__
-        gui = ModernChromeGUI.__new__(ModernChromeGUI)
-
-        # Test method existence
+        # Test method existence on the class; no instance is needed
         methods = [
             'launch_brave_browser',
             'open_email_server',
@@ -76,12 +74,15 @@ def test_button_methods():
             'navigate_to_url'
         ]
 
+        available = set(dir(ModernChromeGUI))
+        missing = [method for method in methods if method not in available]
         for method in methods:
-            if hasattr(gui, method):
-                print(f"[OK] Method {method} exists")
-            else:
+            if method in missing:
                 print(f"[ERROR] Method {method} missing")
-                return False
+            else:
+                print(f"[OK] Method {method} exists")
+        if missing:
+            return False
 
         print("[OK] All button methods defined")
         return True
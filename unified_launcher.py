@@ -6,21 +6,66 @@ Runs GUI and Web Server simultaneously with proper coordination
 
 import os
 import sys
-import subprocess
 import threading
 import time
 import signal
 import atexit
 from pathlib import Path
-import requests
+
+from health_utils import HEALTH_URL, probe_health
+
+# Console blocks are written in one call so server-thread output cannot interleave
+RULE = "=" * 70
+BANNER = f"""
+{RULE}
+           🤖 REAL LIFE AI TOOLS - UNIFIED SYSTEM
+{RULE}
+🚀 Launching Complete AI Ecosystem:
+   • 🖥️  Modern GUI with Embedded Discord Browser
+   • 🌐 Flask Web Server with AI Email System
+   • 🧠 AI-Powered Analytics & Security
+   • 🔗 Seamless GUI-Web Integration
+{RULE}
+"""
+STATUS_BANNER = f"""
+{RULE}
+🎯 SYSTEM STATUS: FULLY OPERATIONAL
+{RULE}
+✅ AI Email Server: http://localhost:5000
+✅ Health Check: {HEALTH_URL}
+✅ GUI Integration: Active
+✅ AI Analytics: Running
+✅ Security Engine: Active
+{RULE}
+🎮 LAUNCHING GUI NOW...
+Press Ctrl+C to shutdown both GUI and server gracefully
+{RULE}
+
+"""
+
+# Seconds a health check result is reused before the server is probed again
+HEALTH_CACHE_TTL = 5
+
+# Monitor polling tiers: healthy, retrying after a failure, and persistently failing
+HOT, WARM, COLD = 'hot', 'warm', 'cold'
+POLL_INTERVALS = {HOT: 30, WARM: 2, COLD: 30}
+
+# Consecutive failed probes before the monitor drops from WARM to COLD
+WARM_RETRIES = 3
+
+# Set once on any shutdown path (signal, GUI exit, atexit); background workers wait on it
+SHUTDOWN = threading.Event()
 
 class UnifiedLauncher:
     def __init__(self):
         self.project_root = Path(__file__).parent
-        self.server_process = None
+        self.server = None
         self.server_thread = None
         self.gui_process = None
-        self.running = True
+        self.stop_event = SHUTDOWN
+
+        # (monotonic time, result) of the last health check
+        self.health_cache = (0.0, False)
 
         # Register cleanup handler
         atexit.register(self.cleanup)
@@ -29,52 +74,47 @@ class UnifiedLauncher:
 
     def print_banner(self):
         """Print the startup banner"""
-        print("\n" + "=" * 70)
-        print("           🤖 REAL LIFE AI TOOLS - UNIFIED SYSTEM")
-        print("=" * 70)
-        print("🚀 Launching Complete AI Ecosystem:")
-        print("   • 🖥️  Modern GUI with Embedded Discord Browser")
-        print("   • 🌐 Flask Web Server with AI Email System")
-        print("   • 🧠 AI-Powered Analytics & Security")
-        print("   • 🔗 Seamless GUI-Web Integration")
-        print("=" * 70)
-
-    def check_server_health(self):
-        """Check if the web server is responding"""
+        sys.stdout.write(BANNER)
+        sys.stdout.flush()
+
+    def check_server_health(self, max_age=HEALTH_CACHE_TTL):
+        """Check if the web server is responding, reusing a result up to max_age seconds old"""
+        now = time.monotonic()
+        checked_at, healthy = self.health_cache
+        if now - checked_at < max_age:
+            return healthy
+
         try:
-            response = requests.get("http://localhost:5000/health", timeout=5)
-            return response.status_code == 200
+            healthy = probe_health().status_code == 200
         except:
-            return False
+            healthy = False
+
+        self.health_cache = (now, healthy)
+        return healthy
 
     def start_web_server(self):
         """Start the Flask web server"""
         print("📧 Starting AI Email Web Server...")
 
         try:
-            # Start server in background process
-            self.server_process = subprocess.Popen([
-                sys.executable, "-c",
-                """
-import os
-import sys
-sys.path.insert(0, os.getcwd())
-from email_server import app
-print("🌐 AI Email Server running on http://localhost:5000")
-print("📊 Health check: http://localhost:5000/health")
-print("🎮 GUI integration active")
-app.run(host='0.0.0.0', port=5000, debug=False, use_reloader=False, threaded=True)
-                """
-            ], cwd=self.project_root)
-
-            # Wait for server to start
-            print("⏳ Waiting for server to initialize...")
-            for i in range(10):  # Wait up to 10 seconds
-                if self.check_server_health():
-                    print("✅ AI Email Server is healthy and responding!")
-                    print("🔗 GUI-Web integration established")
-                    return True
-                time.sleep(1)
+            # Serve from a daemon thread in this process instead of a second interpreter
+            from email_server import app
+            from werkzeug.serving import make_server
+
+            # make_server binds and listens before returning, so the port is ready once it does;
+            # requests arriving before serve_forever starts simply wait in the listen backlog
+            self.server = make_server('0.0.0.0', 5000, app, threaded=True)
+            self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+            self.server_thread.start()
+            print("🌐 AI Email Server running on http://localhost:5000")
+            print("📊 Health check: http://localhost:5000/health")
+            print("🎮 GUI integration active")
+
+            # One probe confirms the app itself answers
+            if self.check_server_health(max_age=0):
+                print("✅ AI Email Server is healthy and responding!")
+                print("🔗 GUI-Web integration established")
+                return True
 
             print("⚠️ Server started but health check failed - continuing anyway")
             return True
@@ -96,7 +136,8 @@ app.run(host='0.0.0.0', port=5000, debug=False, use_reloader=False, threaded=Tru
             print("🎯 Ready for AI-powered operations")
 
             # Create and run GUI
-            gui = ModernChromeGUI()
+            # The GUI watches SHUTDOWN so Ctrl+C closes the window along with the server
+            gui = ModernChromeGUI(shutdown_event=SHUTDOWN)
 
             # Override the GUI's run method to handle shutdown properly
             original_run = gui.run
@@ -106,7 +147,7 @@ app.run(host='0.0.0.0', port=5000, debug=False, use_reloader=False, threaded=Tru
                 except KeyboardInterrupt:
                     print("\n👋 GUI shutdown requested")
                 finally:
-                    self.running = False
+                    self.stop()
 
             gui.run = enhanced_run
             gui.run()
@@ -117,51 +158,46 @@ app.run(host='0.0.0.0', port=5000, debug=False, use_reloader=False, threaded=Tru
             print(f"❌ GUI Error: {e}")
             print("💡 The web server may still be running")
         finally:
-            self.running = False
+            self.stop()
 
     def monitor_system(self):
         """Monitor both GUI and server health"""
-        while self.running:
-            try:
-                # Check server health
-                if self.server_process and self.server_process.poll() is not None:
-                    print("⚠️ Web server process terminated")
-                    self.running = False
-                    break
-
-                # Check server responsiveness every 30 seconds
-                if time.time() % 30 < 1:  # Check roughly every 30 seconds
-                    if not self.check_server_health():
-                        print("⚠️ Web server not responding to health checks")
-                    else:
-                        print("💚 System health: OK")
-
-                time.sleep(1)
-
-            except KeyboardInterrupt:
+        # Poll every 30s while healthy, retry every 2s after a failure, and
+        # fall back to 30s once failures persist
+        state, failures = HOT, 0
+        while not self.stop_event.wait(POLL_INTERVALS[state]):
+            # Check server health
+            if self.server_thread and not self.server_thread.is_alive():
+                print("⚠️ Web server thread stopped")
+                self.stop()
                 break
 
+            # Warm retries must reach the server rather than the cached result
+            if self.check_server_health(max_age=0 if state == WARM else HEALTH_CACHE_TTL):
+                print("💚 System health: OK")
+                state, failures = HOT, 0
+            else:
+                print("⚠️ Web server not responding to health checks")
+                failures += 1
+                state = WARM if failures < WARM_RETRIES else COLD
+
+    def stop(self):
+        """Signal shutdown to every thread waiting on SHUTDOWN"""
+        self.stop_event.set()
+
     def signal_handler(self, signum, frame):
         """Handle shutdown signals"""
         print(f"\n📴 Received signal {signum} - initiating graceful shutdown...")
-        self.running = False
+        self.stop()
 
     def cleanup(self):
         """Clean up processes on exit"""
         print("\n🧹 Performing system cleanup...")
+        self.stop()
 
-        # Terminate web server
-        if self.server_process and self.server_process.poll() is None:
+        if self.server_thread and self.server_thread.is_alive():
             print("🛑 Stopping web server...")
-            try:
-                self.server_process.terminate()
-                self.server_process.wait(timeout=5)
-                print("✅ Web server stopped")
-            except subprocess.TimeoutExpired:
-                print("⚠️ Web server didn't stop gracefully, force killing...")
-                self.server_process.kill()
-            except Exception as e:
-                print(f"⚠️ Error stopping web server: {e}")
+            self.server.shutdown()
 
         print("👋 Cleanup complete - System shutdown")
 
@@ -183,25 +219,12 @@ app.run(host='0.0.0.0', port=5000, debug=False, use_reloader=False, threaded=Tru
             print("❌ Failed to start web server. Cannot continue.")
             return False
 
-        # Give server a moment to fully initialize
-        time.sleep(2)
-
         # Start monitoring thread
         monitor_thread = threading.Thread(target=self.monitor_system, daemon=True)
         monitor_thread.start()
 
-        print("\n" + "=" * 70)
-        print("🎯 SYSTEM STATUS: FULLY OPERATIONAL")
-        print("=" * 70)
-        print("✅ AI Email Server: http://localhost:5000")
-        print("✅ Health Check: http://localhost:5000/health")
-        print("✅ GUI Integration: Active")
-        print("✅ AI Analytics: Running")
-        print("✅ Security Engine: Active")
-        print("=" * 70)
-        print("🎮 LAUNCHING GUI NOW...")
-        print("Press Ctrl+C to shutdown both GUI and server gracefully")
-        print("=" * 70 + "\n")
+        sys.stdout.write(STATUS_BANNER)
+        sys.stdout.flush()
 
         # Start GUI (this will block until GUI exits)
         self.start_gui_application()